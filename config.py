@@ -7,9 +7,24 @@ including default values, environment variables, and user preferences.
 """
 
 import os
+import copy
 import json
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Tuple
+from storage import atomic_write, dumps, loads
+
+
+# Parsed config files keyed by path, stored with the mtime they were read at
+_CONFIG_CACHE: Dict[Path, Tuple[int, Dict[str, Any]]] = {}
+
+# Environment overrides as (variable, config key, type) triples
+_ENV_MAPPINGS = (
+    ("TASK_CLI_DATA_FILE", "data_file", str),
+    ("TASK_CLI_DATE_FORMAT", "date_format", str),
+    ("TASK_CLI_MAX_DESC_LENGTH", "max_description_length", int),
+    ("TASK_CLI_TASKS_PER_PAGE", "tasks_per_page", int),
+)
 
 
 class Config:
@@ -27,6 +42,9 @@ class Config:
         "valid_priorities": ["low", "medium", "high"],
         "backup_enabled": True,
         "backup_count": 5,
+        "backup_interval": 60,
+        "journal_enabled": False,
+        "journal_compact_ratio": 4,
         "colors": {
             "todo": "yellow",
             "in-progress": "blue", 
@@ -44,38 +62,45 @@ class Config:
     
     def _load_config(self) -> Dict[str, Any]:
         """Load configuration from file or environment variables."""
-        config = self.DEFAULT_CONFIG.copy()
+        config = json.loads(_DEFAULT_JSON)
         
         # Load from config file if exists
-        if self.config_file.exists():
-            try:
-                with open(self.config_file, 'r', encoding='utf-8') as f:
-                    file_config = json.load(f)
-                    config.update(file_config)
-            except (json.JSONDecodeError, IOError):
-                pass  # Use defaults if config file is invalid
+        file_config = self._read_config_file()
+        if file_config:
+            config.update(file_config)
         
         # Override with environment variables
-        env_mappings = {
-            "TASK_CLI_DATA_FILE": "data_file",
-            "TASK_CLI_DATE_FORMAT": "date_format",
-            "TASK_CLI_MAX_DESC_LENGTH": "max_description_length",
-            "TASK_CLI_TASKS_PER_PAGE": "tasks_per_page"
-        }
-        
-        for env_var, config_key in env_mappings.items():
-            env_value = os.getenv(env_var)
+        env = os.environ
+        for env_var, config_key, caster in _ENV_MAPPINGS:
+            env_value = env.get(env_var)
             if env_value:
-                if config_key in ["max_description_length", "tasks_per_page"]:
-                    try:
-                        config[config_key] = int(env_value)
-                    except ValueError:
-                        pass
-                else:
-                    config[config_key] = env_value
+                try:
+                    config[config_key] = caster(env_value)
+                except ValueError:
+                    pass
         
         return config
     
+    def _read_config_file(self) -> Optional[Dict[str, Any]]:
+        """Read the config file, reusing the cached parse while its mtime is unchanged."""
+        try:
+            mtime = self.config_file.stat().st_mtime_ns
+        except OSError:
+            return None
+        
+        cache_key = self.config_file.absolute()
+        cached = _CONFIG_CACHE.get(cache_key)
+        if cached and cached[0] == mtime:
+            return copy.deepcopy(cached[1])
+        
+        try:
+            file_config = loads(self.config_file.read_bytes())
+        except (json.JSONDecodeError, IOError):
+            return None  # Use defaults if config file is invalid
+        
+        _CONFIG_CACHE[cache_key] = (mtime, file_config)
+        return copy.deepcopy(file_config)
+    
     def get(self, key: str, default: Any = None) -> Any:
         """Get configuration value."""
         return self.config.get(key, default)
@@ -87,16 +112,28 @@ class Config:
     def save_config(self) -> None:
         """Save current configuration to file."""
         try:
-            with open(self.config_file, 'w', encoding='utf-8') as f:
-                json.dump(self.config, f, indent=2, ensure_ascii=False)
+            atomic_write(self.config_file, dumps(self.config))
         except IOError as e:
             print(f"Warning: Could not save configuration: {e}")
     
     def reset_to_defaults(self) -> None:
         """Reset configuration to default values."""
-        self.config = self.DEFAULT_CONFIG.copy()
+        self.config = json.loads(_DEFAULT_JSON)
         self.save_config()
 
 
-# Global configuration instance
-config = Config()
+# Defaults serialized once; json.loads gives a fresh deep copy faster than copy.deepcopy
+_DEFAULT_JSON = json.dumps(Config.DEFAULT_CONFIG)
+
+
+@lru_cache(maxsize=1)
+def get_config() -> Config:
+    """Return the shared configuration instance, loading it on first use."""
+    return Config()
+
+
+def __getattr__(name: str) -> Any:
+    """Resolve the legacy module-level ``config`` instance lazily."""
+    if name == "config":
+        return get_config()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
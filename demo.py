@@ -6,30 +6,37 @@ This script demonstrates all the enhanced functionality of the Task Tracker CLI
 including new features like categories, priorities, due dates, search, and statistics.
 """
 
-import subprocess
-import sys
+import shlex
 import time
 import os
 
-def run_command(command, description):
-    """Run a command and display the output with description."""
+import task_cli
+
+
+def run_command(command, description, tracker, parser):
+    """Run a command in-process against the shared tracker and describe it."""
     print(f"\n{'='*70}")
     print(f"📝 {description}")
     print(f"{'='*70}")
     print(f"Command: {command}")
     print("-" * 70)
     
-    # Run the command
+    # Drop the leading "python task_cli.py" and dispatch like the CLI would
     try:
-        result = subprocess.run(command, shell=True, capture_output=True, text=True)
-        if result.stdout:
-            print(result.stdout)
-        if result.stderr:
-            print(f"Error: {result.stderr}")
+        args = parser.parse_args(shlex.split(command)[2:])
+        task_cli.execute_command(tracker, args)
+    except SystemExit:
+        pass  # --help and argument errors exit from argparse
     except Exception as e:
         print(f"Failed to run command: {e}")
     
-    time.sleep(1.5)  # Brief pause for readability
+    # Optional pause for readability, e.g. DEMO_PACE=1.5
+    try:
+        pace = float(os.environ.get("DEMO_PACE", "0"))
+    except ValueError:
+        pace = 0  # Ignore a malformed value rather than abort the demo
+    if pace > 0:
+        time.sleep(pace)
 
 def main():
     """Run the enhanced demo."""
@@ -52,6 +59,10 @@ def main():
         os.remove("tasks.json")
         print("\n🧹 Cleaned up existing tasks.json file")
     
+    # One tracker and parser are shared by every command in the demo
+    tracker = task_cli.TaskTracker("tasks.json")
+    parser = task_cli.create_parser(prog="task_cli.py")
+    
     # Basic functionality demo
     basic_commands = [
         ("python task_cli.py --help", "Show enhanced help message"),
@@ -64,7 +75,7 @@ def main():
     
     print(f"\n{'🎯 BASIC FUNCTIONALITY DEMO':=^70}")
     for command, description in basic_commands:
-        run_command(command, description)
+        run_command(command, description, tracker, parser)
     
     # Enhanced listing and filtering demo
     listing_commands = [
@@ -77,7 +88,7 @@ def main():
     
     print(f"\n{'📋 ENHANCED LISTING & FILTERING':=^70}")
     for command, description in listing_commands:
-        run_command(command, description)
+        run_command(command, description, tracker, parser)
     
     # Task management demo
     management_commands = [
@@ -89,7 +100,7 @@ def main():
     
     print(f"\n{'⚙️ TASK MANAGEMENT DEMO':=^70}")
     for command, description in management_commands:
-        run_command(command, description)
+        run_command(command, description, tracker, parser)
     
     # Search functionality demo
     search_commands = [
@@ -100,7 +111,7 @@ def main():
     
     print(f"\n{'🔍 SEARCH FUNCTIONALITY DEMO':=^70}")
     for command, description in search_commands:
-        run_command(command, description)
+        run_command(command, description, tracker, parser)
     
     # Statistics demo
     stats_commands = [
@@ -111,7 +122,7 @@ def main():
     
     print(f"\n{'📊 STATISTICS & REPORTING DEMO':=^70}")
     for command, description in stats_commands:
-        run_command(command, description)
+        run_command(command, description, tracker, parser)
     
     # Error handling demonstrations
     print(f"\n{'🚨 ERROR HANDLING DEMONSTRATIONS':=^70}")
@@ -127,7 +138,7 @@ def main():
     ]
     
     for command, description in error_commands:
-        run_command(command, description)
+        run_command(command, description, tracker, parser)
     
     # Advanced features demo
     print(f"\n{'🔧 ADVANCED FEATURES DEMO':=^70}")
@@ -140,10 +151,10 @@ def main():
     ]
     
     for command, description in advanced_commands:
-        run_command(command, description)
+        run_command(command, description, tracker, parser)
     
     # Final statistics
-    run_command("python task_cli.py stats", "Final comprehensive statistics")
+    run_command("python task_cli.py stats", "Final comprehensive statistics", tracker, parser)
     
     print(f"\n{'='*70}")
     print("✅ Enhanced Demo completed!")
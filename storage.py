@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+"""
+Storage module for Task Tracker CLI
+
+This module provides helpers for reading and writing the JSON files used
+by the Task Tracker CLI. orjson is used when installed, with the standard
+library json module as a fallback.
+"""
+
+import os
+import json
+from pathlib import Path
+from typing import Any, Union
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+    # Match the stdlib fallback, which converts non-string keys to strings
+    _ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def dumps(obj: Any) -> bytes:
+    """Serialize an object to indented UTF-8 JSON, using orjson if available."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, option=_ORJSON_OPTIONS | orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2, ensure_ascii=False).encode("utf-8")
+
+
+def dumps_line(obj: Any) -> bytes:
+    """Serialize an object to compact single-line UTF-8 JSON."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, option=_ORJSON_OPTIONS)
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def loads(data: Union[bytes, str]) -> Any:
+    """Parse JSON data, using orjson if available."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def atomic_write(path: Union[str, Path], data: bytes) -> None:
+    """Write data to a temporary sibling file, sync it and move it over the target."""
+    path = Path(path)
+    tmp = path.with_suffix(path.suffix + ".tmp")
+    with open(tmp, "wb") as f:
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
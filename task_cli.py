@@ -4,30 +4,160 @@ import json
 import sys
 import os
 import argparse
+import shutil
+from collections import Counter
+from operator import itemgetter
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Dict, List, Optional, Any
-from config import config
+from typing import Dict, Iterable, List, Optional, Any, Tuple
+from config import get_config
+from storage import atomic_write, dumps, dumps_line, loads
 from utils import (
-    format_task_table, print_success, print_error, print_warning, print_info,
-    get_color_for_status, get_color_for_priority, COLORS_AVAILABLE
+    format_task_table, format_info, format_success, format_warning,
+    print_success, print_error, print_warning, print_info,
+    get_color_for_status, get_color_for_priority, install_resize_handler, COLORS_AVAILABLE,
+    ISO_DATE_FORMAT
 )
 
+_now = datetime.now
+
+
+def _parse_due_ordinal(due_date: Optional[str]) -> Optional[int]:
+    """Convert a YYYY-MM-DD due date to a day ordinal, or None if missing or invalid."""
+    if not due_date:
+        return None
+    try:
+        return datetime.strptime(due_date, "%Y-%m-%d").toordinal()
+    except ValueError:
+        return None
+
+
+def _due_ordinal(task: Dict[str, Any]) -> Optional[int]:
+    """Return a task's due day ordinal, using the cached value when the task has one."""
+    if "_due_ordinal" in task:
+        return task["_due_ordinal"]
+    return _parse_due_ordinal(task.get("due_date"))
+
+
+def _description_lc(task: Dict[str, Any]) -> str:
+    """Return a task's lowercased description, using the cached value when the task has one."""
+    return task.get("_description_lc") or task["description"].lower()
+
+
+# Sort keys by option; stored fields use C-level itemgetter keys. Description
+# and category also accept tasks that have not been through _index_task.
+_SORT_KEYS = {
+    "id": itemgetter("id"),
+    "description": _description_lc,
+    "status": itemgetter("status"),
+    "category": lambda t: t.get("category", "general"),
+    "created": itemgetter("createdAt"),
+    "updated": itemgetter("updatedAt"),
+}
+
+
+def _public_fields(task: Dict[str, Any]) -> Dict[str, Any]:
+    """Return a copy of a task without the in-memory ``_``-prefixed fields."""
+    return {key: value for key, value in task.items() if not key.startswith("_")}
+
+
+def _bisect_id(tasks: List[Dict[str, Any]], task_id: int) -> int:
+    """Return the first position whose task id is not less than task_id."""
+    lo, hi = 0, len(tasks)
+    while lo < hi:
+        mid = (lo + hi) // 2
+        if tasks[mid]["id"] < task_id:
+            lo = mid + 1
+        else:
+            hi = mid
+    return lo
+
+
+def _index_of(tasks: List[Dict[str, Any]], task: Dict[str, Any]) -> int:
+    """Find a task's position, bisecting on id since tasks are kept in id order."""
+    lo = _bisect_id(tasks, task["id"])
+    if lo < len(tasks) and tasks[lo] is task:
+        return lo
+    # Hand-edited files may not be in id order; fall back to an identity scan
+    return next(i for i, t in enumerate(tasks) if t is task)
+
 
 class TaskTracker:
     """Main class for managing tasks with enhanced functionality."""
     
-    def __init__(self, data_file: Optional[str] = None):
-        """Initialize TaskTracker with data file path."""
-        self.data_file = Path(data_file or config.get("data_file"))
-        self.tasks = self._load_tasks()
-        self._ensure_backup_dir()
+    def __init__(self, data_file: Optional[str] = None, backup_dir: Optional[str] = None):
+        """Initialize TaskTracker with data file path and optional backup directory."""
+        self.data_file = Path(data_file or get_config().get("data_file"))
+        self.backup_dir = Path(backup_dir or "backups")
+        self.journal_file = self.data_file.with_suffix(".log")
+        self._journal_pending: List[Dict[str, Any]] = []
+        self._snapshot_loaded = False
+        self._tasks: Optional[Dict[str, Any]] = None
+        self._by_id: Dict[int, Dict[str, Any]] = {}
+        self._by_status: Dict[str, List[Dict[str, Any]]] = {}
+        # Settings read on every operation, looked up once per tracker
+        config = get_config()
+        self._statuses = tuple(config.get("valid_statuses"))
+        self._valid_statuses = frozenset(self._statuses)
+        self._priority_rank = {
+            priority: rank for rank, priority in enumerate(config.get("valid_priorities"))
+        }
+        self._default_status = sys.intern(config.get("default_status"))
+        self._max_desc_len = config.get("max_description_length")
+        self._date_format = config.get("date_format")
+        self._dirty = False
+        self._batch_depth = 0
+    
+    @property
+    def tasks(self) -> Dict[str, Any]:
+        """Task data, loaded from the data file on first access."""
+        return self._ensure_loaded()
+    
+    @tasks.setter
+    def tasks(self, data: Dict[str, Any]) -> None:
+        """Replace the task data and rebuild the lookup indexes."""
+        self._tasks = data
+        self._by_id = {task["id"]: task for task in data["tasks"]}
+        self._by_status = {status: [] for status in self._statuses}
+        for task in data["tasks"]:
+            self._index_task(task)
+            self._by_status.setdefault(task["status"], []).append(task)
+    
+    def _index_task(self, task: Dict[str, Any]) -> None:
+        """Cache derived fields on a task; they are kept in memory only and never saved."""
+        task["_due_ordinal"] = _parse_due_ordinal(task.get("due_date"))
+        task["_description_lc"] = task["description"].lower()
+    
+    def _set_status(self, task: Dict[str, Any], status: str) -> None:
+        """Change a task's status and move it to the matching status bucket."""
+        # Buckets are kept in id order, so both ends of the move are found by bisection
+        old_bucket = self._by_status[task["status"]]
+        del old_bucket[_index_of(old_bucket, task)]
+        new_bucket = self._by_status.setdefault(status, [])
+        new_bucket.insert(_bisect_id(new_bucket, task["id"]), task)
+        task["status"] = status
+    
+    def _ensure_loaded(self) -> Dict[str, Any]:
+        """Load the data file if it has not been read yet."""
+        if self._tasks is None:
+            self.tasks = self._load_tasks()
+        return self._tasks
+    
+    def __enter__(self) -> "TaskTracker":
+        """Defer saving until the end of the block so a batch of changes is written once."""
+        self._batch_depth += 1
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        """Write any pending changes once the outermost block ends."""
+        self._batch_depth -= 1
+        if self._batch_depth == 0 and self._dirty:
+            self._save_tasks()
     
     def _ensure_backup_dir(self) -> None:
         """Ensure backup directory exists."""
-        if config.get("backup_enabled"):
-            backup_dir = Path("backups")
-            backup_dir.mkdir(exist_ok=True)
+        if get_config().get("backup_enabled"):
+            self.backup_dir.mkdir(exist_ok=True)
     
     def _load_tasks(self) -> Dict[str, Any]:
         """Load tasks from JSON file, create empty structure if file doesn't exist."""
@@ -43,30 +173,41 @@ class TaskTracker:
             }
         
         try:
-            with open(self.data_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                # Ensure the structure is correct and migrate if needed
-                if "tasks" not in data:
-                    data["tasks"] = []
-                if "next_id" not in data:
-                    data["next_id"] = 1
-                if "metadata" not in data:
-                    data["metadata"] = {
-                        "version": "2.0",
-                        "created": self._get_current_timestamp(),
-                        "last_modified": self._get_current_timestamp()
-                    }
-                
-                # Migrate old tasks to new format if needed
-                for task in data["tasks"]:
-                    if "category" not in task:
-                        task["category"] = "general"
-                    if "priority" not in task:
-                        task["priority"] = "medium"
-                    if "due_date" not in task:
-                        task["due_date"] = None
-                
-                return data
+            data = loads(self.data_file.read_bytes())
+            # Ensure the structure is correct and migrate if needed
+            if "tasks" not in data:
+                data["tasks"] = []
+            if "next_id" not in data:
+                data["next_id"] = 1
+            if "metadata" not in data:
+                data["metadata"] = {
+                    "version": "2.0",
+                    "created": self._get_current_timestamp(),
+                    "last_modified": self._get_current_timestamp()
+                }
+            
+            # Apply changes appended since the file was last rewritten
+            self._replay_journal(data)
+            self._snapshot_loaded = True
+            
+            # Never hand out an id that is already taken, whatever the stored counter says
+            data["next_id"] = max(
+                data["next_id"], max((task["id"] for task in data["tasks"]), default=0) + 1
+            )
+            
+            # Migrate old tasks to new format if needed, interning the repeated
+            # status/category strings so comparisons hit the identity fast path.
+            # Categories are stored lowercase so filters can compare them directly.
+            for task in data["tasks"]:
+                status = task.get("status")
+                task["status"] = sys.intern(status if isinstance(status, str) else self._default_status)
+                task["category"] = sys.intern((task.get("category") or "general").lower())
+                if "priority" not in task:
+                    task["priority"] = "medium"
+                if "due_date" not in task:
+                    task["due_date"] = None
+            
+            return data
         except (json.JSONDecodeError, IOError) as e:
             print(f"Error loading tasks file: {e}")
             print("Creating new tasks file...")
@@ -80,32 +221,157 @@ class TaskTracker:
                 }
             }
     
+    def _replay_journal(self, data: Dict[str, Any]) -> None:
+        """Apply journaled task changes on top of the loaded data file."""
+        if not self.journal_file.exists():
+            return
+        
+        tasks_by_id = {task["id"]: task for task in data["tasks"]}
+        next_id = data["next_id"]
+        generation = data["metadata"].get("journal_generation", 0)
+        skipped = 0
+        with open(self.journal_file, 'rb') as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                # A bad line (e.g. one torn by a crash mid-append) loses only that change
+                try:
+                    record = loads(line)
+                    # Records from an older generation are already in the snapshot;
+                    # they survive only if a compaction stopped before removing the journal
+                    if record.get("gen", 0) < generation:
+                        continue
+                    if record["op"] == "put":
+                        task = record["task"]
+                        tasks_by_id[task["id"]] = task
+                        next_id = max(next_id, task["id"] + 1)
+                    elif record["op"] == "delete":
+                        tasks_by_id.pop(record["id"], None)
+                except (json.JSONDecodeError, KeyError, TypeError, AttributeError):
+                    skipped += 1
+        
+        if skipped:
+            print_warning(f"Skipped {skipped} malformed line(s) in {self.journal_file}.")
+        
+        data["tasks"] = list(tasks_by_id.values())
+        data["next_id"] = next_id
+    
+    def _journal(self, op: str, **fields: Any) -> None:
+        """Queue a change record for the journal when journaling is enabled."""
+        if get_config().get("journal_enabled"):
+            self._journal_pending.append(dict(op=op, **fields))
+    
+    def _should_append_journal(self) -> bool:
+        """Check whether pending changes can be appended instead of rewriting the file."""
+        if not (self._journal_pending and self._snapshot_loaded):
+            return False
+        try:
+            base_size = self.data_file.stat().st_size
+            journal_size = self.journal_file.stat().st_size if self.journal_file.exists() else 0
+        except OSError:
+            return False
+        return journal_size < base_size * get_config().get("journal_compact_ratio", 4)
+    
     def _save_tasks(self) -> None:
-        """Save tasks to JSON file with backup support."""
-        # Create backup if enabled
-        if config.get("backup_enabled") and self.data_file.exists():
+        """Save tasks by appending to the journal or rewriting the JSON file."""
+        if self._should_append_journal():
+            self._append_journal()
+        else:
+            self.compact()
+        
+        self._dirty = False
+    
+    def _append_journal(self) -> None:
+        """Append pending change records to the journal file in one write."""
+        # Tag records with the snapshot's generation so replay can tell them from stale ones
+        generation = self.tasks["metadata"].get("journal_generation", 0)
+        data = b"".join(
+            dumps_line(dict(record, gen=generation, task=_public_fields(record["task"]))
+                       if "task" in record else dict(record, gen=generation))
+            + b"\n"
+            for record in self._journal_pending
+        )
+        try:
+            with open(self.journal_file, 'a+b') as f:
+                # A crash mid-append can leave the last line without its newline; end it
+                # first so these records are not glued onto the torn fragment
+                end = f.seek(0, os.SEEK_END)
+                if end:
+                    f.seek(end - 1)
+                    if f.read(1) != b"\n":
+                        data = b"\n" + data
+                f.write(data)
+        except IOError as e:
+            print(f"Error saving tasks journal: {e}")
+            sys.exit(1)
+        
+        self._journal_pending.clear()
+    
+    def compact(self) -> None:
+        """Rewrite the JSON file from memory with backup support and clear the journal."""
+        # Create backup if enabled and the last one is old enough
+        if get_config().get("backup_enabled") and self.data_file.exists() and self._backup_due():
             self._create_backup()
         
-        # Update metadata
-        self.tasks["metadata"]["last_modified"] = self._get_current_timestamp()
+        # Update metadata; a new journal generation marks every existing record as covered
+        metadata = self.tasks["metadata"]
+        metadata["last_modified"] = self._get_current_timestamp()
+        metadata["journal_generation"] = metadata.get("journal_generation", 0) + 1
         
         try:
-            with open(self.data_file, 'w', encoding='utf-8') as f:
-                json.dump(self.tasks, f, indent=2, ensure_ascii=False)
+            tasks = [_public_fields(task) for task in self.tasks["tasks"]]
+            atomic_write(self.data_file, dumps(dict(self.tasks, tasks=tasks)))
+            if self.journal_file.exists():
+                self.journal_file.unlink()
         except IOError as e:
             print(f"Error saving tasks file: {e}")
             sys.exit(1)
+        
+        self._journal_pending.clear()
+        self._snapshot_loaded = True
+    
+    def _maybe_save(self) -> None:
+        """Record a pending change and save it unless a batch is in progress."""
+        self._dirty = True
+        if not self._batch_depth:
+            self._save_tasks()
+    
+    def _backup_due(self) -> bool:
+        """Check whether the newest backup is older than the configured interval."""
+        interval = get_config().get("backup_interval", 0)
+        if interval <= 0:
+            return True
+        try:
+            newest = max((mtime for mtime, _ in self._list_backups(self.backup_dir)), default=0)
+        except OSError:
+            return True
+        return datetime.now().timestamp() - newest >= interval
+    
+    def _list_backups(self, backup_dir: Path) -> List[Tuple[float, str]]:
+        """List backup files as (mtime, path) pairs with a single directory scan."""
+        try:
+            with os.scandir(backup_dir) as entries:
+                return [
+                    (entry.stat().st_mtime, entry.path) for entry in entries
+                    if entry.name.startswith("tasks_backup_") and entry.name.endswith(".json")
+                ]
+        except FileNotFoundError:
+            return []
     
     def _create_backup(self) -> None:
         """Create a backup of the current tasks file."""
         try:
-            backup_dir = Path("backups")
+            self._ensure_backup_dir()
+            backup_dir = self.backup_dir
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             backup_file = backup_dir / f"tasks_backup_{timestamp}.json"
             
-            # Copy current file to backup
-            import shutil
-            shutil.copy2(self.data_file, backup_file)
+            # Hardlink the current file; saves replace it rather than write
+            # in place, so the link keeps the old contents. Copy if linking fails.
+            try:
+                os.link(self.data_file, backup_file)
+            except OSError:
+                shutil.copy2(self.data_file, backup_file)
             
             # Clean old backups
             self._cleanup_old_backups(backup_dir)
@@ -116,58 +382,45 @@ class TaskTracker:
     def _cleanup_old_backups(self, backup_dir: Path) -> None:
         """Remove old backup files, keeping only the specified count."""
         try:
-            backup_files = sorted(
-                [f for f in backup_dir.glob("tasks_backup_*.json")],
-                key=lambda x: x.stat().st_mtime,
-                reverse=True
-            )
+            backup_files = sorted(self._list_backups(backup_dir), reverse=True)
             
-            max_backups = config.get("backup_count", 5)
-            for old_backup in backup_files[max_backups:]:
-                old_backup.unlink()
+            max_backups = get_config().get("backup_count", 5)
+            for _, old_backup in backup_files[max_backups:]:
+                os.unlink(old_backup)
                 
         except Exception as e:
             print(f"Warning: Could not cleanup old backups: {e}")
     
     def _get_current_timestamp(self) -> str:
         """Get current timestamp in configurable format."""
-        date_format = config.get("date_format")
-        return datetime.now().strftime(date_format)
+        if self._date_format == ISO_DATE_FORMAT:
+            return _now().isoformat(sep=" ", timespec="microseconds")
+        return _now().strftime(self._date_format)
     
     def search_tasks(self, query: str) -> List[Dict[str, Any]]:
         """Search tasks by description content."""
-        query_lower = query.lower()
-        return [
-            task for task in self.tasks["tasks"]
-            if query_lower in task["description"].lower()
-        ]
+        return self.filter_tasks(self.tasks["tasks"], query=query)
     
     def sort_tasks(self, tasks: List[Dict[str, Any]], sort_by: str = "id", 
                   reverse: bool = False) -> List[Dict[str, Any]]:
         """Sort tasks by specified criteria."""
-        sort_functions = {
-            "id": lambda t: t["id"],
-            "description": lambda t: t["description"].lower(),
-            "status": lambda t: t["status"],
-            "priority": lambda t: config.get("valid_priorities").index(t["priority"]),
-            "category": lambda t: t["category"],
-            "created": lambda t: t["createdAt"],
-            "updated": lambda t: t["updatedAt"],
-            "due_date": lambda t: t.get("due_date") or "9999-12-31"
-        }
-        
-        if sort_by not in sort_functions:
+        if sort_by == "priority":
+            rank = self._priority_rank
+            key = lambda t: rank[t["priority"]]
+        elif sort_by == "due_date":
+            key = lambda t: t.get("due_date") or "9999-12-31"
+        elif sort_by in _SORT_KEYS:
+            key = _SORT_KEYS[sort_by]
+        else:
             print(f"Warning: Invalid sort option '{sort_by}'. Using 'id' instead.")
-            sort_by = "id"
+            key = _SORT_KEYS["id"]
         
-        return sorted(tasks, key=sort_functions[sort_by], reverse=reverse)
+        return sorted(tasks, key=key, reverse=reverse)
     
     def _find_task_by_id(self, task_id: int) -> Optional[Dict[str, Any]]:
         """Find task by ID."""
-        for task in self.tasks["tasks"]:
-            if task["id"] == task_id:
-                return task
-        return None
+        self._ensure_loaded()
+        return self._by_id.get(task_id)
     
     def get_statistics(self) -> Dict[str, Any]:
         """Get comprehensive statistics about tasks."""
@@ -179,58 +432,42 @@ class TaskTracker:
         
         # Status statistics
         status_counts = {}
-        for status in config.get("valid_statuses"):
-            status_counts[status] = sum(1 for task in tasks if task["status"] == status)
-        
-        # Priority statistics
-        priority_counts = {}
-        for priority in config.get("valid_priorities"):
-            priority_counts[priority] = sum(1 for task in tasks if task["priority"] == priority)
-        
-        # Category statistics
-        categories = {}
-        for task in tasks:
-            category = task.get("category", "general")
-            categories[category] = categories.get(category, 0) + 1
-        
-        # Due date statistics
-        today = datetime.now().date()
-        overdue = 0
-        due_today = 0
-        due_this_week = 0
-        
-        for task in tasks:
-            if task.get("due_date"):
-                try:
-                    due_date = datetime.strptime(task["due_date"], "%Y-%m-%d").date()
-                    days_until = (due_date - today).days
-                    
-                    if days_until < 0:
-                        overdue += 1
-                    elif days_until == 0:
-                        due_today += 1
-                    elif days_until <= 7:
-                        due_this_week += 1
-                except ValueError:
-                    pass
+        for status in self._statuses:
+            status_counts[status] = len(self._by_status.get(status, ()))
+        
+        # Priority counts are tallied in C by Counter over itemgetter
+        priority_counter = Counter(map(itemgetter("priority"), tasks))
+        category_counter = Counter(t.get("category", "general") for t in tasks)
+        
+        # Due dates bucketed by days from today, clamped to overdue (-1) and later (8)
+        now = _now()
+        today_ordinal = now.toordinal()
+        due_offsets = Counter(
+            min(max(due_ordinal - today_ordinal, -1), 8)
+            for due_ordinal in map(itemgetter("_due_ordinal"), tasks)
+            if due_ordinal is not None
+        )
+        overdue = due_offsets[-1]
+        due_today = due_offsets[0]
+        due_this_week = sum(due_offsets[days] for days in range(1, 8))
+        
+        # Weekly statistics; only done tasks can count as completed
+        week_ago = (now - timedelta(days=7)).strftime(self._date_format)
+        created_this_week = sum(1 for created in map(itemgetter("createdAt"), tasks) if created > week_ago)
+        completed_this_week = sum(
+            1 for task in self._by_status.get("done", ()) if task.get("updatedAt", "") > week_ago
+        )
+        
+        priority_counts = {
+            priority: priority_counter[priority]
+            for priority in self._priority_rank
+        }
+        categories = dict(category_counter)
         
         # Completion rate
         completed = status_counts.get("done", 0)
         completion_rate = (completed / total_tasks * 100) if total_tasks > 0 else 0
         
-        # Time-based statistics
-        created_this_week = 0
-        completed_this_week = 0
-        week_ago = (datetime.now() - timedelta(days=7)).strftime(config.get("date_format"))
-        
-        for task in tasks:
-            if task["createdAt"] > week_ago:
-                created_this_week += 1
-            
-            if (task["status"] == "done" and 
-                task.get("updatedAt", "") > week_ago):
-                completed_this_week += 1
-        
         return {
             "total": total_tasks,
             "status_counts": status_counts,
@@ -256,85 +493,81 @@ class TaskTracker:
             print_info(stats["message"])
             return
         
-        print_info("📊 Task Statistics Report")
-        print("=" * 50)
+        # Build the whole report and write it in one call
+        total = stats['total']
+        out = [format_info("📊 Task Statistics Report"), "=" * 50]
         
         # Overall statistics
-        print(f"\n📋 Overall Statistics:")
-        print(f"   Total tasks: {stats['total']}")
-        print(f"   Completion rate: {stats['completion_rate']:.1f}%")
+        out.append(f"\n📋 Overall Statistics:")
+        out.append(f"   Total tasks: {total}")
+        out.append(f"   Completion rate: {stats['completion_rate']:.1f}%")
         
         # Status breakdown
-        print(f"\n📈 Status Breakdown:")
+        out.append(f"\n📈 Status Breakdown:")
         for status, count in stats['status_counts'].items():
-            percentage = (count / stats['total'] * 100) if stats['total'] > 0 else 0
-            if COLORS_AVAILABLE:
-                color = get_color_for_status(status)
-                print(f"   {color}{status.capitalize()}: {count} ({percentage:.1f}%)")
-            else:
-                print(f"   {status.capitalize()}: {count} ({percentage:.1f}%)")
+            percentage = (count / total * 100) if total > 0 else 0
+            color = get_color_for_status(status) if COLORS_AVAILABLE else ""
+            out.append(f"   {color}{status.capitalize()}: {count} ({percentage:.1f}%)")
         
         # Priority breakdown
-        print(f"\n🎯 Priority Breakdown:")
+        out.append(f"\n🎯 Priority Breakdown:")
         for priority, count in stats['priority_counts'].items():
-            percentage = (count / stats['total'] * 100) if stats['total'] > 0 else 0
-            if COLORS_AVAILABLE:
-                color = get_color_for_priority(priority)
-                print(f"   {color}{priority.capitalize()}: {count} ({percentage:.1f}%)")
-            else:
-                print(f"   {priority.capitalize()}: {count} ({percentage:.1f}%)")
+            percentage = (count / total * 100) if total > 0 else 0
+            color = get_color_for_priority(priority) if COLORS_AVAILABLE else ""
+            out.append(f"   {color}{priority.capitalize()}: {count} ({percentage:.1f}%)")
         
         # Category breakdown
         if stats['categories']:
-            print(f"\n📂 Category Breakdown:")
+            out.append(f"\n📂 Category Breakdown:")
             for category, count in sorted(stats['categories'].items()):
-                percentage = (count / stats['total'] * 100) if stats['total'] > 0 else 0
-                print(f"   {category.capitalize()}: {count} ({percentage:.1f}%)")
+                percentage = (count / total * 100) if total > 0 else 0
+                out.append(f"   {category.capitalize()}: {count} ({percentage:.1f}%)")
         
         # Due date warnings
         due_stats = stats['due_stats']
         if any(due_stats.values()):
-            print(f"\n⏰ Due Date Summary:")
+            out.append(f"\n⏰ Due Date Summary:")
             if due_stats['overdue'] > 0:
-                print_warning(f"   Overdue tasks: {due_stats['overdue']}")
+                out.append(format_warning(f"   Overdue tasks: {due_stats['overdue']}"))
             if due_stats['due_today'] > 0:
-                print_warning(f"   Due today: {due_stats['due_today']}")
+                out.append(format_warning(f"   Due today: {due_stats['due_today']}"))
             if due_stats['due_this_week'] > 0:
-                print_info(f"   Due this week: {due_stats['due_this_week']}")
+                out.append(format_info(f"   Due this week: {due_stats['due_this_week']}"))
         
         # Weekly productivity
         weekly = stats['weekly_stats']
-        print(f"\n📅 This Week's Activity:")
-        print(f"   Created: {weekly['created_this_week']} tasks")
-        print(f"   Completed: {weekly['completed_this_week']} tasks")
+        out.append(f"\n📅 This Week's Activity:")
+        out.append(f"   Created: {weekly['created_this_week']} tasks")
+        out.append(f"   Completed: {weekly['completed_this_week']} tasks")
         
         productivity_trend = weekly['completed_this_week'] - weekly['created_this_week']
         if productivity_trend > 0:
-            print_success(f"   You're ahead! +{productivity_trend} net tasks completed")
+            out.append(format_success(f"   You're ahead! +{productivity_trend} net tasks completed"))
         elif productivity_trend < 0:
-            print_warning(f"   You're behind by {abs(productivity_trend)} tasks")
+            out.append(format_warning(f"   You're behind by {abs(productivity_trend)} tasks"))
         else:
-            print_info("   You're keeping pace!")
+            out.append(format_info("   You're keeping pace!"))
         
-        print()  # Empty line at the end
+        out.append("")  # Empty line at the end
+        sys.stdout.write("\n".join(out) + "\n")
     
     def add_task(self, description: str, category: str = "general", 
                  priority: str = "medium", due_date: Optional[str] = None) -> None:
         """Add a new task with category, priority, and optional due date."""
-        if not description.strip():
+        description = description.strip()
+        if not description:
             print("Error: Task description cannot be empty.")
             return
         
         # Validate description length
-        max_length = config.get("max_description_length")
-        if len(description.strip()) > max_length:
+        max_length = self._max_desc_len
+        if len(description) > max_length:
             print(f"Error: Task description too long. Maximum {max_length} characters allowed.")
             return
         
         # Validate priority
-        valid_priorities = config.get("valid_priorities")
-        if priority not in valid_priorities:
-            print(f"Error: Invalid priority '{priority}'. Valid priorities are: {', '.join(valid_priorities)}")
+        if priority not in self._priority_rank:
+            print(f"Error: Invalid priority '{priority}'. Valid priorities are: {', '.join(self._priority_rank)}")
             return
         
         # Parse due date if provided
@@ -349,18 +582,22 @@ class TaskTracker:
         current_time = self._get_current_timestamp()
         new_task = {
             "id": self.tasks["next_id"],
-            "description": description.strip(),
-            "status": config.get("default_status"),
-            "category": category.lower(),
+            "description": description,
+            "status": self._default_status,
+            "category": sys.intern(category.lower()),
             "priority": priority,
             "due_date": parsed_due_date,
             "createdAt": current_time,
             "updatedAt": current_time
         }
+        self._index_task(new_task)
         
         self.tasks["tasks"].append(new_task)
+        self._by_id[new_task["id"]] = new_task
+        self._by_status.setdefault(new_task["status"], []).append(new_task)
         self.tasks["next_id"] += 1
-        self._save_tasks()
+        self._journal("put", task=new_task)
+        self._maybe_save()
         
         print_success(f"Task added successfully (ID: {new_task['id']})")
         if category != "general":
@@ -370,16 +607,23 @@ class TaskTracker:
         if due_date:
             print_info(f"Due date: {due_date}")
     
+    def add_tasks(self, specs: Iterable[Tuple[Any, ...]]) -> None:
+        """Add several tasks from add_task argument tuples, saving once at the end."""
+        with self:
+            for spec in specs:
+                self.add_task(*spec)
+    
     def update_task(self, task_id: int, new_description: str, new_category: Optional[str] = None,
                    new_priority: Optional[str] = None, new_due_date: Optional[str] = None) -> None:
         """Update task with enhanced options."""
-        if not new_description.strip():
+        new_description = new_description.strip()
+        if not new_description:
             print_error("Task description cannot be empty.")
             return
         
         # Validate description length
-        max_length = config.get("max_description_length")
-        if len(new_description.strip()) > max_length:
+        max_length = self._max_desc_len
+        if len(new_description) > max_length:
             print_error(f"Task description too long. Maximum {max_length} characters allowed.")
             return
         
@@ -389,8 +633,8 @@ class TaskTracker:
             return
         
         # Validate priority if provided
-        if new_priority and new_priority not in config.get("valid_priorities"):
-            print_error(f"Invalid priority '{new_priority}'. Valid priorities are: {', '.join(config.get('valid_priorities'))}")
+        if new_priority and new_priority not in self._priority_rank:
+            print_error(f"Invalid priority '{new_priority}'. Valid priorities are: {', '.join(self._priority_rank)}")
             return
         
         # Parse due date if provided
@@ -401,17 +645,26 @@ class TaskTracker:
                 print_error("Invalid due date format. Use YYYY-MM-DD format.")
                 return
         
-        # Update task fields
-        task["description"] = new_description.strip()
+        # Skip the save entirely when nothing would change
+        updated = {"description": new_description}
         if new_category is not None:
-            task["category"] = new_category.lower()
+            updated["category"] = sys.intern(new_category.lower())
         if new_priority is not None:
-            task["priority"] = new_priority
+            updated["priority"] = new_priority
         if new_due_date is not None:
-            task["due_date"] = new_due_date
+            updated["due_date"] = new_due_date
+        
+        if all(task.get(field) == value for field, value in updated.items()):
+            print_info(f"Task {task_id} is unchanged.")
+            return
         
+        # Update task fields
+        task.update(updated)
+        
+        self._index_task(task)
         task["updatedAt"] = self._get_current_timestamp()
-        self._save_tasks()
+        self._journal("put", task=task)
+        self._maybe_save()
         
         print_success(f"Task {task_id} updated successfully.")
     
@@ -422,8 +675,12 @@ class TaskTracker:
             print_error(f"Task with ID {task_id} not found.")
             return
         
-        self.tasks["tasks"] = [t for t in self.tasks["tasks"] if t["id"] != task_id]
-        self._save_tasks()
+        del self._by_id[task_id]
+        bucket = self._by_status[task["status"]]
+        del bucket[_index_of(bucket, task)]
+        del self.tasks["tasks"][_index_of(self.tasks["tasks"], task)]
+        self._journal("delete", id=task_id)
+        self._maybe_save()
         
         print_success(f"Task {task_id} deleted successfully.")
     
@@ -438,9 +695,10 @@ class TaskTracker:
             print_warning(f"Task {task_id} is already in progress.")
             return
         
-        task["status"] = "in-progress"
+        self._set_status(task, "in-progress")
         task["updatedAt"] = self._get_current_timestamp()
-        self._save_tasks()
+        self._journal("put", task=task)
+        self._maybe_save()
         
         print_success(f"Task {task_id} marked as in progress.")
     
@@ -455,9 +713,10 @@ class TaskTracker:
             print_warning(f"Task {task_id} is already done.")
             return
         
-        task["status"] = "done"
+        self._set_status(task, "done")
         task["updatedAt"] = self._get_current_timestamp()
-        self._save_tasks()
+        self._journal("put", task=task)
+        self._maybe_save()
         
         print_success(f"Task {task_id} marked as done.")
     
@@ -466,25 +725,23 @@ class TaskTracker:
                   sort_by: str = "id", reverse: bool = False, 
                   due_soon: bool = False) -> None:
         """List tasks with enhanced filtering and formatting."""
-        valid_statuses = config.get("valid_statuses")
+        if status_filter:
+            status_filter = sys.intern(status_filter)
         
-        if status_filter and status_filter not in valid_statuses:
-            print_error(f"Invalid status '{status_filter}'. Valid statuses are: {', '.join(valid_statuses)}")
+        if status_filter and status_filter not in self._valid_statuses:
+            print_error(f"Invalid status '{status_filter}'. Valid statuses are: {', '.join(self._statuses)}")
             return
         
-        # Start with all tasks
-        tasks_to_show = self.tasks["tasks"]
-        
-        # Apply search filter
-        if search_query:
-            tasks_to_show = [
-                task for task in tasks_to_show 
-                if search_query.lower() in task["description"].lower()
-            ]
+        # Start with the matching status bucket, or all tasks
+        self._ensure_loaded()
+        if status_filter:
+            tasks_to_show = self._by_status.get(status_filter, [])
+        else:
+            tasks_to_show = self.tasks["tasks"]
         
-        # Apply filters
+        # Apply the remaining filters; status was handled by the bucket lookup
         tasks_to_show = self.filter_tasks(
-            tasks_to_show, status_filter, category_filter, priority_filter, due_soon
+            tasks_to_show, None, category_filter, priority_filter, due_soon, search_query
         )
         
         # Sort tasks
@@ -509,9 +766,8 @@ class TaskTracker:
                 print_info("No tasks found.")
             return
         
-        # Print formatted table
-        print("\n" + format_task_table(tasks_to_show))
-        print(f"\nTotal: {len(tasks_to_show)} task(s)")
+        # Build the whole report and write it in one call
+        out = ["", format_task_table(tasks_to_show), "", f"Total: {len(tasks_to_show)} task(s)"]
         
         # Show filter info if any filters were applied
         if any([status_filter, category_filter, priority_filter, search_query, due_soon]):
@@ -527,37 +783,44 @@ class TaskTracker:
             if due_soon:
                 filter_info.append("due soon")
             
-            print_info(f"Filtered by: {', '.join(filter_info)}")
+            out.append(format_info(f"Filtered by: {', '.join(filter_info)}"))
+        
+        sys.stdout.write("\n".join(out) + "\n")
     
     def filter_tasks(self, tasks: List[Dict[str, Any]], status: Optional[str] = None, 
                     category: Optional[str] = None, priority: Optional[str] = None, 
-                    due_soon: bool = False) -> List[Dict[str, Any]]:
-        """Apply filters to task list."""
-        filtered_tasks = tasks
-        
-        if status:
-            filtered_tasks = [t for t in filtered_tasks if t["status"] == status]
-        
-        if category:
-            filtered_tasks = [t for t in filtered_tasks if t.get("category", "general") == category.lower()]
+                    due_soon: bool = False, query: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Apply filters to task list in a single pass; tasks need not come from this tracker."""
+        if not (status or category or priority or due_soon or query):
+            return tasks
         
-        if priority:
-            filtered_tasks = [t for t in filtered_tasks if t.get("priority", "medium") == priority]
+        category_lower = category.lower() if category else None
+        query_lower = query.lower() if query else None
+        week_from_now = _now().toordinal() + 7 if due_soon else None
         
-        if due_soon:
-            today = datetime.now().date()
-            week_from_now = today + timedelta(days=7)
-            filtered_tasks = [
-                t for t in filtered_tasks 
-                if t.get("due_date") and datetime.strptime(t["due_date"], "%Y-%m-%d").date() <= week_from_now
-            ]
-        
-        return filtered_tasks
+        # A task without a due date is treated as due after the window, so it never matches
+        return [
+            t for t in tasks
+            if (not status or t["status"] == status)
+            and (not category_lower or t.get("category", "general") == category_lower)
+            and (not priority or t.get("priority", "medium") == priority)
+            and (not due_soon or (_due_ordinal(t) or week_from_now + 1) <= week_from_now)
+            and (not query_lower or query_lower in _description_lc(t))
+        ]
 
 
-def create_parser() -> argparse.ArgumentParser:
-    """Create and configure argument parser."""
+def _parse_id(value: str) -> int:
+    """Parse a task ID argument, rejecting non-numeric values."""
+    try:
+        return int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"Task ID must be a number, got '{value}'.")
+
+
+def create_parser(prog: Optional[str] = None) -> argparse.ArgumentParser:
+    """Create and configure argument parser; prog overrides the program name shown in usage."""
     parser = argparse.ArgumentParser(
+        prog=prog,
         description="Task Tracker CLI - Enhanced task management tool",
         formatter_class=argparse.RawDescriptionHelpFormatter,
         epilog="""
@@ -568,6 +831,7 @@ Examples:
   %(prog)s search "grocery"
   %(prog)s stats
   %(prog)s mark-done 1
+  %(prog)s batch < commands.txt
         """
     )
     
@@ -583,7 +847,7 @@ Examples:
     
     # Update command
     update_parser = subparsers.add_parser('update', help='Update an existing task')
-    update_parser.add_argument('id', type=int, help='Task ID')
+    update_parser.add_argument('id', type=_parse_id, help='Task ID')
     update_parser.add_argument('description', help='New task description')
     update_parser.add_argument('--category', '-c', help='New task category')
     update_parser.add_argument('--priority', '-p', choices=['low', 'medium', 'high'], 
@@ -592,14 +856,14 @@ Examples:
     
     # Delete command
     delete_parser = subparsers.add_parser('delete', help='Delete a task')
-    delete_parser.add_argument('id', type=int, help='Task ID')
+    delete_parser.add_argument('id', type=_parse_id, help='Task ID')
     
     # Mark commands
     mark_progress_parser = subparsers.add_parser('mark-in-progress', help='Mark task as in progress')
-    mark_progress_parser.add_argument('id', type=int, help='Task ID')
+    mark_progress_parser.add_argument('id', type=_parse_id, help='Task ID')
     
     mark_done_parser = subparsers.add_parser('mark-done', help='Mark task as done')
-    mark_done_parser.add_argument('id', type=int, help='Task ID')
+    mark_done_parser.add_argument('id', type=_parse_id, help='Task ID')
     
     # List command
     list_parser = subparsers.add_parser('list', help='List tasks')
@@ -627,6 +891,9 @@ Examples:
     # Statistics command
     stats_parser = subparsers.add_parser('stats', help='Show task statistics')
     
+    # Batch command
+    subparsers.add_parser('batch', help='Run commands read from stdin, one per line')
+    
     # Global options
     parser.add_argument('--data-file', help='Custom data file path')
     parser.add_argument('--no-color', action='store_true', help='Disable colored output')
@@ -635,70 +902,104 @@ Examples:
     return parser
 
 
-def main():
+def _search_command(tracker: TaskTracker, args: argparse.Namespace) -> None:
+    """Search tasks and print the matches as a table."""
+    search_results = tracker.filter_tasks(
+        tracker.tasks["tasks"], args.status, args.category, args.priority, query=args.query
+    )
+    
+    if not search_results:
+        print_info(f"No tasks found matching '{args.query}'")
+    else:
+        print(f"\n{format_task_table(search_results)}")
+        print(f"\nFound: {len(search_results)} task(s) matching '{args.query}'")
+
+
+# Command name -> handler taking the tracker and the parsed arguments
+COMMAND_HANDLERS = {
+    'add': lambda tracker, args: tracker.add_task(
+        args.description, args.category, args.priority, args.due),
+    'update': lambda tracker, args: tracker.update_task(
+        args.id, args.description, args.category, args.priority, args.due),
+    'delete': lambda tracker, args: tracker.delete_task(args.id),
+    'mark-in-progress': lambda tracker, args: tracker.mark_in_progress(args.id),
+    'mark-done': lambda tracker, args: tracker.mark_done(args.id),
+    'list': lambda tracker, args: tracker.list_tasks(
+        status_filter=args.status,
+        category_filter=args.category,
+        priority_filter=args.priority,
+        due_soon=args.due_soon,
+        sort_by=args.sort,
+        reverse=args.reverse
+    ),
+    'search': _search_command,
+    'stats': lambda tracker, args: tracker.print_statistics(),
+}
+
+
+def execute_command(tracker: TaskTracker, args: argparse.Namespace) -> None:
+    """Run a single parsed command against the tracker."""
+    handler = COMMAND_HANDLERS.get(args.command)
+    if handler:
+        handler(tracker, args)
+
+
+def run_batch(tracker: TaskTracker, parser: argparse.ArgumentParser, 
+              lines: Iterable[str]) -> None:
+    """Run one command per line against a single tracker, saving once at the end."""
+    import shlex  # Only batch mode needs it
+    
+    with tracker:
+        for line_number, line in enumerate(lines, 1):
+            line = line.strip()
+            if not line or line.startswith('#'):
+                continue
+            
+            try:
+                args = parser.parse_args(shlex.split(line))
+            except (SystemExit, ValueError):
+                print_error(f"Line {line_number}: invalid command '{line}'")
+                continue
+            
+            if args.command in (None, 'batch'):
+                print_error(f"Line {line_number}: invalid command '{line}'")
+                continue
+            
+            # Every line shares the batch's tracker and output settings
+            if args.data_file or args.no_color:
+                print_error(f"Line {line_number}: --data-file and --no-color are not supported in batch lines")
+                continue
+            
+            execute_command(tracker, args)
+
+
+def main(argv: Optional[List[str]] = None):
     """Main entry point with enhanced argument parsing."""
     parser = create_parser()
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
     
-    # If no command provided, show help
-    if not args.command:
+    # If no known command provided, show help without touching the data file
+    if args.command != 'batch' and args.command not in COMMAND_HANDLERS:
         parser.print_help()
         return
     
-    # Initialize task tracker
-    tracker = TaskTracker(args.data_file)
-    
     try:
         # Handle global options
         if args.no_color:
             global COLORS_AVAILABLE
             COLORS_AVAILABLE = False
         
-        # Execute commands
-        if args.command == 'add':
-            tracker.add_task(args.description, args.category, args.priority, args.due)
-        
-        elif args.command == 'update':
-            tracker.update_task(args.id, args.description, args.category, 
-                              args.priority, args.due)
-        
-        elif args.command == 'delete':
-            tracker.delete_task(args.id)
-        
-        elif args.command == 'mark-in-progress':
-            tracker.mark_in_progress(args.id)
-        
-        elif args.command == 'mark-done':
-            tracker.mark_done(args.id)
-        
-        elif args.command == 'list':
-            tracker.list_tasks(
-                status_filter=args.status,
-                category_filter=args.category,
-                priority_filter=args.priority,
-                due_soon=args.due_soon,
-                sort_by=args.sort,
-                reverse=args.reverse
-            )
+        # Keep table widths current if the terminal is resized mid-batch
+        install_resize_handler()
         
-        elif args.command == 'search':
-            # Get search results
-            search_results = tracker.search_tasks(args.query)
-            
-            # Apply additional filters
-            if args.status or args.category or args.priority:
-                search_results = tracker.filter_tasks(
-                    search_results, args.status, args.category, args.priority
-                )
-            
-            if not search_results:
-                print_info(f"No tasks found matching '{args.query}'")
-            else:
-                print(f"\n{format_task_table(search_results)}")
-                print(f"\nFound: {len(search_results)} task(s) matching '{args.query}'")
+        # Initialize task tracker only once the command is known to be valid
+        tracker = TaskTracker(args.data_file)
         
-        elif args.command == 'stats':
-            tracker.print_statistics()
+        # Execute commands
+        if args.command == 'batch':
+            run_batch(tracker, parser, sys.stdin)
+        else:
+            execute_command(tracker, args)
     
     except KeyboardInterrupt:
         print_warning("\nOperation cancelled by user.")
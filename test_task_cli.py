@@ -13,41 +13,106 @@ import json
 import tempfile
 import os
 import sys
+import copy
+import shutil
 from pathlib import Path
+from datetime import datetime, timedelta
 from io import StringIO
-from contextlib import redirect_stdout, redirect_stderr
+from contextlib import redirect_stderr
+from unittest.mock import patch
 
 # Add the current directory to Python path to import our module
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
-from task_cli import TaskTracker
-from config import config
+from task_cli import TaskTracker, create_parser, run_batch
+from config import Config, get_config
 
 
-class TestTaskTracker(unittest.TestCase):
+# In-memory tasks for tests that need data but no add_task calls
+_TIMESTAMP = "2025-07-22 10:00:00.000000"
+SEED_TASKS = {
+    "tasks": [
+        {"id": 1, "description": "Buy groceries", "status": "done",
+         "category": "shopping", "priority": "high", "due_date": None,
+         "createdAt": _TIMESTAMP, "updatedAt": _TIMESTAMP},
+        {"id": 2, "description": "Write documentation", "status": "in-progress",
+         "category": "work", "priority": "medium", "due_date": None,
+         "createdAt": _TIMESTAMP, "updatedAt": _TIMESTAMP},
+        {"id": 3, "description": "Review grocery list", "status": "todo",
+         "category": "shopping", "priority": "low", "due_date": None,
+         "createdAt": _TIMESTAMP, "updatedAt": _TIMESTAMP},
+    ],
+    "next_id": 4,
+    "metadata": {"version": "2.0", "created": _TIMESTAMP, "last_modified": _TIMESTAMP}
+}
+
+# Keep scratch files on a RAM-backed filesystem where one exists so saves never touch disk
+_SCRATCH_ROOT = "/dev/shm" if os.path.isdir("/dev/shm") and os.access("/dev/shm", os.W_OK) else None
+
+
+_fsync_patch = patch("storage.os.fsync")
+
+
+def setUpModule():
+    """Skip fsync on saves; tests only need the data, not durability."""
+    _fsync_patch.start()
+
+
+def tearDownModule():
+    """Restore synced saves."""
+    _fsync_patch.stop()
+
+
+class TrackerTestMixin:
+    """Helpers shared by the TaskTracker test cases."""
+    
+    def _capture_stdout(self):
+        """Capture stdout for the rest of the test instead of redirecting it per call."""
+        stdout_patch = patch('sys.stdout', new_callable=StringIO)
+        self.stdout = stdout_patch.start()
+        self.addCleanup(stdout_patch.stop)
+    
+    def _clear_output(self):
+        """Discard output captured so far."""
+        self.stdout.seek(0)
+        self.stdout.truncate()
+    
+    def _set_config(self, key, value):
+        """Change a config setting for the rest of the test."""
+        config = get_config()
+        self.addCleanup(config.set, key, config.get(key))
+        config.set(key, value)
+
+
+class TestTaskTracker(TrackerTestMixin, unittest.TestCase):
     """Test cases for enhanced TaskTracker class."""
     
+    @classmethod
+    def setUpClass(cls):
+        """Create the class's scratch directory and an empty tasks file to start from."""
+        cls._tmpdir = tempfile.TemporaryDirectory(dir=_SCRATCH_ROOT)
+        cls._template_path = os.path.join(cls._tmpdir.name, "template.json")
+        TaskTracker(cls._template_path).compact()
+    
+    @classmethod
+    def tearDownClass(cls):
+        """Remove the class's scratch directory."""
+        cls._tmpdir.cleanup()
+    
     def setUp(self):
         """Set up test environment before each test."""
-        # Create a temporary file for testing
-        self.temp_file = tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.json')
-        self.temp_file.close()
-        self.tracker = TaskTracker(self.temp_file.name)
-    
-    def tearDown(self):
-        """Clean up after each test."""
-        # Remove temporary file
-        if os.path.exists(self.temp_file.name):
-            os.unlink(self.temp_file.name)
-        # Clean up backup directory if created
-        backup_dir = Path("backups")
-        if backup_dir.exists():
-            for backup_file in backup_dir.glob("*.json"):
-                backup_file.unlink()
-            try:
-                backup_dir.rmdir()
-            except OSError:
-                pass
+        # Give each test its own tasks file, copied from the shared template
+        self.data_file = os.path.join(self._tmpdir.name, f"{self._testMethodName}.json")
+        shutil.copyfile(self._template_path, self.data_file)
+        # The tracker only creates this directory when it writes a backup
+        self.backup_dir = Path(self.data_file).with_suffix(".backups")
+        self.tracker = TaskTracker(self.data_file, backup_dir=self.backup_dir)
+        
+        self._capture_stdout()
+    
+    def _load_seed(self):
+        """Give the tracker a fresh copy of the seed tasks."""
+        self.tracker.tasks = copy.deepcopy(SEED_TASKS)
     
     def test_initial_state(self):
         """Test initial state of enhanced TaskTracker."""
@@ -59,9 +124,9 @@ class TestTaskTracker(unittest.TestCase):
     def test_add_task(self):
         """Test adding a new task with backward compatibility."""
         # Capture output
-        with StringIO() as buf, redirect_stdout(buf):
-            self.tracker.add_task("Test task")
-            output = buf.getvalue()
+        self._clear_output()
+        self.tracker.add_task("Test task")
+        output = self.stdout.getvalue()
         
         # Check if task was added
         self.assertEqual(len(self.tracker.tasks["tasks"]), 1)
@@ -79,9 +144,9 @@ class TestTaskTracker(unittest.TestCase):
     def test_add_task_enhanced(self):
         """Test adding a new task with enhanced features."""
         # Capture output
-        with StringIO() as buf, redirect_stdout(buf):
-            self.tracker.add_task("Test task", "work", "high", "2025-07-30")
-            output = buf.getvalue()
+        self._clear_output()
+        self.tracker.add_task("Test task", "work", "high", "2025-07-30")
+        output = self.stdout.getvalue()
         
         # Check if task was added
         self.assertEqual(len(self.tracker.tasks["tasks"]), 1)
@@ -101,16 +166,16 @@ class TestTaskTracker(unittest.TestCase):
         """Test adding an empty task (should not be added)."""
         initial_count = len(self.tracker.tasks["tasks"])
         
-        with StringIO() as buf, redirect_stdout(buf):
-            self.tracker.add_task("")
-            output = buf.getvalue()
+        self._clear_output()
+        self.tracker.add_task("")
+        output = self.stdout.getvalue()
         
         self.assertEqual(len(self.tracker.tasks["tasks"]), initial_count)
         self.assertIn("Task description cannot be empty.", output)
         
-        with StringIO() as buf, redirect_stdout(buf):
-            self.tracker.add_task("   ")
-            output = buf.getvalue()
+        self._clear_output()
+        self.tracker.add_task("   ")
+        output = self.stdout.getvalue()
         
         self.assertEqual(len(self.tracker.tasks["tasks"]), initial_count)
         self.assertIn("Task description cannot be empty.", output)
@@ -120,19 +185,32 @@ class TestTaskTracker(unittest.TestCase):
         initial_count = len(self.tracker.tasks["tasks"])
         
         # Test invalid priority
-        with StringIO() as buf, redirect_stdout(buf):
-            self.tracker.add_task("Test", "general", "invalid")
-            output = buf.getvalue()
+        self._clear_output()
+        self.tracker.add_task("Test", "general", "invalid")
+        output = self.stdout.getvalue()
         self.assertEqual(len(self.tracker.tasks["tasks"]), initial_count)
         self.assertIn("Invalid priority", output)
         
         # Test invalid due date
-        with StringIO() as buf, redirect_stdout(buf):
-            self.tracker.add_task("Test", "general", "medium", "invalid-date")
-            output = buf.getvalue()
+        self._clear_output()
+        self.tracker.add_task("Test", "general", "medium", "invalid-date")
+        output = self.stdout.getvalue()
         self.assertEqual(len(self.tracker.tasks["tasks"]), initial_count)
         self.assertIn("Invalid due date format", output)
     
+    def test_add_tasks(self):
+        """Test adding several tasks with a single save."""
+        with patch.object(self.tracker, "_save_tasks", wraps=self.tracker._save_tasks) as save:
+            self.tracker.add_tasks([("Task 1",), ("Task 2", "work", "high"), ("",)])
+        
+        self.assertEqual(save.call_count, 1)
+        self.assertEqual([t["description"] for t in self.tracker.tasks["tasks"]], ["Task 1", "Task 2"])
+        self.assertEqual(self.tracker.tasks["tasks"][1]["priority"], "high")
+        self.assertIn("Task description cannot be empty.", self.stdout.getvalue())
+        
+        reloaded = TaskTracker(self.data_file, backup_dir=self.backup_dir)
+        self.assertEqual(len(reloaded.tasks["tasks"]), 2)
+    
     def test_update_task(self):
         """Test updating a task with backward compatibility."""
         # Add a task first
@@ -140,9 +218,9 @@ class TestTaskTracker(unittest.TestCase):
         original_created_at = self.tracker.tasks["tasks"][0]["createdAt"]
         
         # Update the task
-        with StringIO() as buf, redirect_stdout(buf):
-            self.tracker.update_task(1, "Updated task")
-            output = buf.getvalue()
+        self._clear_output()
+        self.tracker.update_task(1, "Updated task")
+        output = self.stdout.getvalue()
         
         # Check if task was updated
         task = self.tracker.tasks["tasks"][0]
@@ -157,9 +235,9 @@ class TestTaskTracker(unittest.TestCase):
         self.tracker.add_task("Original task", "work", "medium")
         
         # Update with enhanced options
-        with StringIO() as buf, redirect_stdout(buf):
-            self.tracker.update_task(1, "Updated task", "personal", "high", "2025-08-01")
-            output = buf.getvalue()
+        self._clear_output()
+        self.tracker.update_task(1, "Updated task", "personal", "high", "2025-08-01")
+        output = self.stdout.getvalue()
         
         # Check if task was updated
         task = self.tracker.tasks["tasks"][0]
@@ -169,43 +247,46 @@ class TestTaskTracker(unittest.TestCase):
         self.assertEqual(task["due_date"], "2025-08-01")
         self.assertIn("Task 1 updated successfully.", output)
     
-    def test_update_nonexistent_task(self):
-        """Test updating a task that doesn't exist."""
-        initial_count = len(self.tracker.tasks["tasks"])
+    def test_update_task_unchanged(self):
+        """Test that an update with identical values does not save."""
+        self.tracker.add_task("Original task", "work", "high")
+        original_updated_at = self.tracker.tasks["tasks"][0]["updatedAt"]
+        mtime = os.stat(self.data_file).st_mtime_ns
         
-        with StringIO() as buf, redirect_stdout(buf):
-            self.tracker.update_task(999, "Updated task")
-            output = buf.getvalue()
+        self._clear_output()
+        self.tracker.update_task(1, "  Original task ", "Work", "high")
+        output = self.stdout.getvalue()
         
-        self.assertEqual(len(self.tracker.tasks["tasks"]), initial_count)
-        self.assertIn("Task with ID 999 not found.", output)
+        self.assertEqual(self.tracker.tasks["tasks"][0]["updatedAt"], original_updated_at)
+        self.assertEqual(os.stat(self.data_file).st_mtime_ns, mtime)
+        self.assertIn("Task 1 is unchanged.", output)
     
     def test_delete_task(self):
         """Test deleting a task."""
         # Add tasks
-        self.tracker.add_task("Task 1")
-        self.tracker.add_task("Task 2")
+        with self.tracker:
+            self.tracker.add_task("Task 1")
+            self.tracker.add_task("Task 2")
         self.assertEqual(len(self.tracker.tasks["tasks"]), 2)
         
         # Delete first task
-        with StringIO() as buf, redirect_stdout(buf):
-            self.tracker.delete_task(1)
-            output = buf.getvalue()
+        self._clear_output()
+        self.tracker.delete_task(1)
+        output = self.stdout.getvalue()
         
         self.assertEqual(len(self.tracker.tasks["tasks"]), 1)
         self.assertEqual(self.tracker.tasks["tasks"][0]["id"], 2)
         self.assertIn("Task 1 deleted successfully.", output)
     
-    def test_delete_nonexistent_task(self):
-        """Test deleting a task that doesn't exist."""
-        initial_count = len(self.tracker.tasks["tasks"])
+    def test_delete_task_out_of_order(self):
+        """Test deleting from a task list that is not sorted by id."""
+        self.tracker.add_tasks([("Task 1",), ("Task 2",), ("Task 3",)])
+        tasks = self.tracker.tasks["tasks"]
+        tasks.reverse()
         
-        with StringIO() as buf, redirect_stdout(buf):
-            self.tracker.delete_task(999)
-            output = buf.getvalue()
+        self.tracker.delete_task(2)
         
-        self.assertEqual(len(self.tracker.tasks["tasks"]), initial_count)
-        self.assertIn("Task with ID 999 not found.", output)
+        self.assertEqual([t["id"] for t in self.tracker.tasks["tasks"]], [3, 1])
     
     def test_mark_in_progress(self):
         """Test marking a task as in progress."""
@@ -214,9 +295,9 @@ class TestTaskTracker(unittest.TestCase):
         original_updated_at = self.tracker.tasks["tasks"][0]["updatedAt"]
         
         # Mark as in progress
-        with StringIO() as buf, redirect_stdout(buf):
-            self.tracker.mark_in_progress(1)
-            output = buf.getvalue()
+        self._clear_output()
+        self.tracker.mark_in_progress(1)
+        output = self.stdout.getvalue()
         
         # Check status
         task = self.tracker.tasks["tasks"][0]
@@ -231,9 +312,9 @@ class TestTaskTracker(unittest.TestCase):
         original_updated_at = self.tracker.tasks["tasks"][0]["updatedAt"]
         
         # Mark as done
-        with StringIO() as buf, redirect_stdout(buf):
-            self.tracker.mark_done(1)
-            output = buf.getvalue()
+        self._clear_output()
+        self.tracker.mark_done(1)
+        output = self.stdout.getvalue()
         
         # Check status
         task = self.tracker.tasks["tasks"][0]
@@ -241,38 +322,26 @@ class TestTaskTracker(unittest.TestCase):
         self.assertNotEqual(task["updatedAt"], original_updated_at)
         self.assertIn("Task 1 marked as done.", output)
     
-    def test_mark_nonexistent_task(self):
-        """Test marking a non-existent task."""
-        with StringIO() as buf, redirect_stdout(buf):
-            self.tracker.mark_in_progress(999)
-            output1 = buf.getvalue()
-        
-        with StringIO() as buf, redirect_stdout(buf):
-            self.tracker.mark_done(999)
-            output2 = buf.getvalue()
-        
-        self.assertIn("Task with ID 999 not found.", output1)
-        self.assertIn("Task with ID 999 not found.", output2)
-    
     def test_list_tasks_empty(self):
         """Test listing tasks when no tasks exist."""
-        with StringIO() as buf, redirect_stdout(buf):
-            self.tracker.list_tasks()
-            output = buf.getvalue()
+        self._clear_output()
+        self.tracker.list_tasks()
+        output = self.stdout.getvalue()
         
         self.assertIn("No tasks found.", output)
     
     def test_list_tasks_with_data(self):
         """Test listing tasks with data."""
         # Add some tasks
-        self.tracker.add_task("Task 1")
-        self.tracker.add_task("Task 2")
-        self.tracker.mark_in_progress(1)
-        self.tracker.mark_done(2)
+        with self.tracker:
+            self.tracker.add_task("Task 1")
+            self.tracker.add_task("Task 2")
+            self.tracker.mark_in_progress(1)
+            self.tracker.mark_done(2)
         
-        with StringIO() as buf, redirect_stdout(buf):
-            self.tracker.list_tasks()
-            output = buf.getvalue()
+        self._clear_output()
+        self.tracker.list_tasks()
+        output = self.stdout.getvalue()
         
         self.assertIn("Task 1", output)
         self.assertIn("Task 2", output)
@@ -283,17 +352,16 @@ class TestTaskTracker(unittest.TestCase):
     def test_list_tasks_with_filter(self):
         """Test listing tasks with status filter."""
         # Add tasks with different statuses
-        self.tracker.add_task("Todo task")
-        self.tracker.add_task("Progress task")
-        self.tracker.add_task("Done task")
-        
-        self.tracker.mark_in_progress(2)
-        self.tracker.mark_done(3)
+        with self.tracker:
+            self.tracker.add_tasks([("Todo task",), ("Progress task",), ("Done task",)])
+            
+            self.tracker.mark_in_progress(2)
+            self.tracker.mark_done(3)
         
         # Test filtering by todo
-        with StringIO() as buf, redirect_stdout(buf):
-            self.tracker.list_tasks(status_filter="todo")
-            output = buf.getvalue()
+        self._clear_output()
+        self.tracker.list_tasks(status_filter="todo")
+        output = self.stdout.getvalue()
         
         self.assertIn("Todo task", output)
         self.assertNotIn("Progress task", output)
@@ -301,9 +369,9 @@ class TestTaskTracker(unittest.TestCase):
         self.assertIn("Total: 1 task(s)", output)
         
         # Test filtering by done
-        with StringIO() as buf, redirect_stdout(buf):
-            self.tracker.list_tasks(status_filter="done")
-            output = buf.getvalue()
+        self._clear_output()
+        self.tracker.list_tasks(status_filter="done")
+        output = self.stdout.getvalue()
         
         self.assertNotIn("Todo task", output)
         self.assertNotIn("Progress task", output)
@@ -313,32 +381,22 @@ class TestTaskTracker(unittest.TestCase):
     def test_list_tasks_enhanced(self):
         """Test enhanced list functionality."""
         # Add test tasks
-        self.tracker.add_task("Work task", "work", "high")
-        self.tracker.add_task("Personal task", "personal", "low")
-        self.tracker.mark_done(1)
+        with self.tracker:
+            self.tracker.add_task("Work task", "work", "high")
+            self.tracker.add_task("Personal task", "personal", "low")
+            self.tracker.mark_done(1)
         
         # Test listing with filters
-        with StringIO() as buf, redirect_stdout(buf):
-            self.tracker.list_tasks(category_filter="work")
-            output = buf.getvalue()
+        self._clear_output()
+        self.tracker.list_tasks(category_filter="work")
+        output = self.stdout.getvalue()
         
         self.assertIn("Work task", output)
         self.assertNotIn("Personal task", output)
     
-    def test_list_tasks_invalid_filter(self):
-        """Test listing tasks with invalid filter."""
-        with StringIO() as buf, redirect_stdout(buf):
-            self.tracker.list_tasks(status_filter="invalid")
-            output = buf.getvalue()
-        
-        self.assertIn("Invalid status 'invalid'", output)
-    
     def test_search_tasks(self):
         """Test task search functionality."""
-        # Add test tasks
-        self.tracker.add_task("Buy groceries", "shopping", "high")
-        self.tracker.add_task("Write documentation", "work", "medium")
-        self.tracker.add_task("Review grocery list", "shopping", "low")
+        self._load_seed()
         
         # Search for "grocer" - should find both "Buy groceries" and "Review grocery list" 
         # because both contain "grocer" (from "groceries" and "grocery")
@@ -349,78 +407,66 @@ class TestTaskTracker(unittest.TestCase):
         results = self.tracker.search_tasks("documentation")
         self.assertEqual(len(results), 1)
         self.assertEqual(results[0]["description"], "Write documentation")
-    
-    def test_filter_tasks(self):
-        """Test task filtering functionality."""
-        # Add test tasks with different attributes
-        self.tracker.add_task("Task 1", "work", "high")
-        self.tracker.add_task("Task 2", "work", "low")
-        self.tracker.add_task("Task 3", "personal", "high")
-        
-        # Filter by category
-        filtered = self.tracker.filter_tasks(self.tracker.tasks["tasks"], category="work")
-        self.assertEqual(len(filtered), 2)
-        
-        # Filter by priority
-        filtered = self.tracker.filter_tasks(self.tracker.tasks["tasks"], priority="high")
-        self.assertEqual(len(filtered), 2)
         
-        # Filter by both category and priority
-        filtered = self.tracker.filter_tasks(self.tracker.tasks["tasks"], category="work", priority="high")
-        self.assertEqual(len(filtered), 1)
+        # Search follows description updates, case-insensitively
+        self.tracker.update_task(2, "Write Release Notes")
+        self.assertEqual(len(self.tracker.search_tasks("documentation")), 0)
+        self.assertEqual(len(self.tracker.search_tasks("release notes")), 1)
+        
+        # The lowercased search copy is kept in memory only
+        with open(self.data_file, encoding="utf-8") as f:
+            saved = json.load(f)
+        self.assertNotIn("_description_lc", saved["tasks"][1])
+        reloaded = TaskTracker(self.data_file, backup_dir=self.backup_dir)
+        self.assertEqual(len(reloaded.search_tasks("RELEASE")), 1)
     
-    def test_sort_tasks(self):
-        """Test task sorting functionality."""
-        # Add test tasks
-        self.tracker.add_task("Z task", "work", "low")
-        self.tracker.add_task("A task", "personal", "high")
-        
-        tasks = self.tracker.tasks["tasks"]
-        
-        # Sort by description
-        sorted_tasks = self.tracker.sort_tasks(tasks, "description")
-        self.assertEqual(sorted_tasks[0]["description"], "A task")
-        self.assertEqual(sorted_tasks[1]["description"], "Z task")
-        
-        # Sort by priority (reverse) - priority index: low=0, medium=1, high=2
-        # So reverse=True should put high (index 2) first, then low (index 0)
-        sorted_tasks = self.tracker.sort_tasks(tasks, "priority", reverse=True)
-        self.assertEqual(sorted_tasks[0]["priority"], "high")  # A task
-        self.assertEqual(sorted_tasks[1]["priority"], "low")   # Z task
+    def test_due_soon(self):
+        """Test the due-soon filter and due date statistics."""
+        today = datetime.now().date()
+        self.tracker.add_task("Overdue", due_date=str(today - timedelta(days=1)))
+        self.tracker.add_task("Due today", due_date=str(today))
+        self.tracker.add_task("Due later", due_date=str(today + timedelta(days=30)))
+        self.tracker.add_task("No due date")
+        self.tracker.update_task(3, "Due this week", new_due_date=str(today + timedelta(days=3)))
+        
+        filtered = self.tracker.filter_tasks(self.tracker.tasks["tasks"], due_soon=True)
+        self.assertEqual([t["id"] for t in filtered], [1, 2, 3])
+        
+        due_stats = self.tracker.get_statistics()["due_stats"]
+        self.assertEqual(due_stats, {"overdue": 1, "due_today": 1, "due_this_week": 1})
+        
+        # Cached fields stay in memory and are not written to the file
+        with open(self.data_file, encoding="utf-8") as f:
+            saved = json.load(f)
+        self.assertNotIn("_due_ordinal", saved["tasks"][0])
+        reloaded = TaskTracker(self.data_file, backup_dir=self.backup_dir)
+        self.assertEqual(len(reloaded.filter_tasks(reloaded.tasks["tasks"], due_soon=True)), 3)
     
-    def test_statistics(self):
-        """Test statistics functionality."""
-        # Add test tasks with different statuses and priorities
-        self.tracker.add_task("Task 1", "work", "high")
-        self.tracker.add_task("Task 2", "work", "medium")
-        self.tracker.add_task("Task 3", "personal", "low")
-        
-        # Mark some tasks as done
-        self.tracker.mark_done(1)
-        self.tracker.mark_in_progress(2)
+    def test_statistics_after_changes(self):
+        """Test that status counts follow status changes and deletions."""
+        with self.tracker:
+            self.tracker.add_tasks([("Task 1",), ("Task 2",), ("Task 3",)])
+            self.tracker.mark_in_progress(1)
+            self.tracker.mark_done(1)
+            self.tracker.mark_done(2)
+            self.tracker.delete_task(2)
         
         stats = self.tracker.get_statistics()
+        self.assertEqual(stats["total"], 2)
+        self.assertEqual(stats["status_counts"], {"todo": 1, "in-progress": 0, "done": 1})
         
-        self.assertEqual(stats["total"], 3)
-        self.assertEqual(stats["status_counts"]["done"], 1)
-        self.assertEqual(stats["status_counts"]["in-progress"], 1)
-        self.assertEqual(stats["status_counts"]["todo"], 1)
-        self.assertAlmostEqual(stats["completion_rate"], 33.3, places=1)
-        
-        # Test category breakdown
-        self.assertEqual(stats["categories"]["work"], 2)
-        self.assertEqual(stats["categories"]["personal"], 1)
-        
-        # Test priority breakdown
-        self.assertEqual(stats["priority_counts"]["high"], 1)
-        self.assertEqual(stats["priority_counts"]["medium"], 1)
-        self.assertEqual(stats["priority_counts"]["low"], 1)
+        # Status buckets stay in id order whatever order tasks move in
+        self.tracker.add_task("Task 4")
+        self.tracker.mark_done(4)
+        self.tracker.mark_done(3)
+        self.assertEqual([t["id"] for t in self.tracker._by_status["done"]], [1, 3, 4])
     
     def test_find_task_by_id(self):
         """Test finding task by ID."""
         # Add tasks
-        self.tracker.add_task("Task 1")
-        self.tracker.add_task("Task 2")
+        with self.tracker:
+            self.tracker.add_task("Task 1")
+            self.tracker.add_task("Task 2")
         
         # Find existing task
         task = self.tracker._find_task_by_id(1)
@@ -431,32 +477,191 @@ class TestTaskTracker(unittest.TestCase):
         task = self.tracker._find_task_by_id(999)
         self.assertIsNone(task)
     
+    def test_id_index_follows_changes(self):
+        """Test that ID lookups stay in sync with adds, deletes and reassignment."""
+        with self.tracker:
+            self.tracker.add_task("Task 1")
+            self.tracker.add_task("Task 2")
+            self.tracker.delete_task(1)
+            self.tracker.add_task("Task 3")
+        
+        self.assertIsNone(self.tracker._find_task_by_id(1))
+        self.assertEqual(self.tracker._find_task_by_id(3)["description"], "Task 3")
+        
+        # Assigning new task data rebuilds the index
+        self.tracker.tasks = {"tasks": [], "next_id": 1, "metadata": {}}
+        self.assertIsNone(self.tracker._find_task_by_id(2))
+    
+    def test_lazy_load(self):
+        """Test that the data file is not read until tasks are accessed."""
+        self.tracker.add_task("Persistent task")
+        
+        new_tracker = TaskTracker(self.data_file, backup_dir=self.backup_dir)
+        self.assertIsNone(new_tracker._tasks)
+        self.assertIsNotNone(new_tracker._find_task_by_id(1))
+        self.assertIsNotNone(new_tracker._tasks)
+    
+    def test_backup_keeps_previous_contents(self):
+        """Test that a backup is unaffected by the save that follows it."""
+        self._set_config("backup_interval", 0)
+        
+        self.tracker.add_task("Task 1")
+        self.tracker.add_task("Task 2")
+        
+        backups = sorted(self.backup_dir.glob("tasks_backup_*.json"))
+        self.assertTrue(backups)
+        with open(backups[-1], encoding="utf-8") as f:
+            self.assertEqual(len(json.load(f)["tasks"]), 1)
+    
+    def test_cleanup_old_backups(self):
+        """Test that only the newest backups are kept."""
+        self._set_config("backup_count", 2)
+        
+        backup_dir = self.backup_dir
+        backup_dir.mkdir()
+        for age in range(3):
+            backup_file = backup_dir / f"tasks_backup_{age}.json"
+            backup_file.write_text("{}")
+            os.utime(backup_file, (1000 - age, 1000 - age))
+        
+        self.tracker._cleanup_old_backups(backup_dir)
+        
+        remaining = sorted(f.name for f in backup_dir.glob("tasks_backup_*.json"))
+        self.assertEqual(remaining, ["tasks_backup_0.json", "tasks_backup_1.json"])
+    
     def test_task_persistence(self):
         """Test that tasks are persisted to file."""
         # Add a task
         self.tracker.add_task("Persistent task")
         
         # Create new tracker instance with same file
-        new_tracker = TaskTracker(self.temp_file.name)
+        new_tracker = TaskTracker(self.data_file, backup_dir=self.backup_dir)
         
         # Check if task is loaded
         self.assertEqual(len(new_tracker.tasks["tasks"]), 1)
         self.assertEqual(new_tracker.tasks["tasks"][0]["description"], "Persistent task")
         self.assertEqual(new_tracker.tasks["next_id"], 2)
     
-    def test_multiple_tasks_workflow(self):
-        """Test a complete workflow with multiple tasks."""
-        # Add multiple tasks
+    def test_batch_save(self):
+        """Test that changes inside a with-block are saved once on exit."""
+        with self.tracker:
+            self.tracker.add_task("Task 1")
+            self.tracker.add_task("Task 2")
+            self.tracker.mark_done(1)
+            
+            # Nothing has been written to disk yet
+            self.assertEqual(len(TaskTracker(self.data_file, backup_dir=self.backup_dir).tasks["tasks"]), 0)
+        
+        reloaded = TaskTracker(self.data_file, backup_dir=self.backup_dir)
+        self.assertEqual(len(reloaded.tasks["tasks"]), 2)
+        self.assertEqual(reloaded._find_task_by_id(1)["status"], "done")
+    
+    def test_journal(self):
+        """Test that journaled changes are appended and replayed on load."""
+        self._set_config("journal_enabled", True)
+        data_file = Path(self.data_file)
+        journal_file = data_file.with_suffix(".log")
+        
+        # The first save writes the full file, later ones only append
         self.tracker.add_task("Task 1")
+        snapshot = data_file.read_bytes()
         self.tracker.add_task("Task 2")
-        self.tracker.add_task("Task 3")
+        self.tracker.mark_done(1)
+        self.tracker.delete_task(2)
+        self.assertEqual(data_file.read_bytes(), snapshot)
+        self.assertTrue(journal_file.exists())
+        
+        reloaded = TaskTracker(self.data_file, backup_dir=self.backup_dir)
+        self.assertEqual(len(reloaded.tasks["tasks"]), 1)
+        self.assertEqual(reloaded._find_task_by_id(1)["status"], "done")
+        self.assertEqual(reloaded.tasks["next_id"], 3)
+        
+        # Compaction folds the journal back into the JSON file
+        reloaded.compact()
+        self.assertFalse(journal_file.exists())
+        compacted = TaskTracker(self.data_file, backup_dir=self.backup_dir)
+        self.assertEqual(compacted.tasks["tasks"], reloaded.tasks["tasks"])
+    
+    def test_journal_left_by_interrupted_compaction(self):
+        """Test that journal records already in the snapshot are not replayed over it."""
+        self._set_config("journal_enabled", True)
+        journal_file = Path(self.data_file).with_suffix(".log")
         
-        # Update a task
-        self.tracker.update_task(2, "Updated Task 2")
+        self.tracker.add_task("Task 1")
+        self.tracker.add_task("Task 2")
+        self.tracker.mark_in_progress(2)
+        stale_journal = journal_file.read_bytes()
         
-        # Mark tasks with different statuses
-        self.tracker.mark_in_progress(1)
-        self.tracker.mark_done(3)
+        # Compact a newer change, then put the journal back as if the process
+        # died after replacing the data file but before removing the journal
+        self.tracker.mark_done(2)
+        self.tracker.compact()
+        journal_file.write_bytes(stale_journal)
+        
+        reloaded = TaskTracker(self.data_file, backup_dir=self.backup_dir)
+        self.assertEqual(reloaded._find_task_by_id(2)["status"], "done")
+        
+        # Changes journaled after the compaction are still replayed
+        reloaded.mark_done(1)
+        self.assertEqual(
+            TaskTracker(self.data_file, backup_dir=self.backup_dir)._find_task_by_id(1)["status"], "done"
+        )
+    
+    def test_journal_malformed_line(self):
+        """Test that a malformed journal line is skipped without losing other changes."""
+        self._set_config("journal_enabled", True)
+        journal_file = Path(self.data_file).with_suffix(".log")
+        
+        self.tracker.add_task("Task 1")
+        self.tracker.add_task("Task 2")
+        # Simulate an append cut short by a crash (so without its newline),
+        # followed by a later good change
+        with open(journal_file, 'ab') as f:
+            f.write(b'{"op":"put","task":{"id":')
+        self.tracker.mark_done(2)
+        
+        self._clear_output()
+        reloaded = TaskTracker(self.data_file, backup_dir=self.backup_dir)
+        self.assertEqual([t["id"] for t in reloaded.tasks["tasks"]], [1, 2])
+        self.assertEqual(reloaded._find_task_by_id(2)["status"], "done")
+        self.assertIn("Skipped 1 malformed line(s)", self.stdout.getvalue())
+    
+    def test_run_batch(self):
+        """Test running several commands from batch input."""
+        lines = [
+            'add "Batch task" --priority high',
+            '# comments and blank lines are skipped',
+            '',
+            'add "Second task"',
+            'mark-done 1',
+            'not-a-command',
+            '--data-file other.json add "Elsewhere"',
+        ]
+        self._clear_output()
+        with redirect_stderr(StringIO()):
+            run_batch(self.tracker, create_parser(), lines)
+        output = self.stdout.getvalue()
+        
+        self.assertIn("Line 6: invalid command", output)
+        self.assertIn("Line 7: --data-file and --no-color are not supported", output)
+        reloaded = TaskTracker(self.data_file, backup_dir=self.backup_dir)
+        self.assertEqual(len(reloaded.tasks["tasks"]), 2)
+        self.assertEqual(reloaded._find_task_by_id(1)["status"], "done")
+        self.assertEqual(reloaded._find_task_by_id(1)["priority"], "high")
+    
+    def test_multiple_tasks_workflow(self):
+        """Test a complete workflow with multiple tasks."""
+        # Apply every change in one batch so the file is written once
+        with self.tracker:
+            # Add multiple tasks
+            self.tracker.add_tasks([("Task 1",), ("Task 2",), ("Task 3",)])
+            
+            # Update a task
+            self.tracker.update_task(2, "Updated Task 2")
+            
+            # Mark tasks with different statuses
+            self.tracker.mark_in_progress(1)
+            self.tracker.mark_done(3)
         
         # Verify final state
         tasks = self.tracker.tasks["tasks"]
@@ -478,13 +683,14 @@ class TestTaskTracker(unittest.TestCase):
     def test_invalid_json_file(self):
         """Test handling of invalid JSON file."""
         # Write invalid JSON to file
-        with open(self.temp_file.name, 'w') as f:
+        with open(self.data_file, 'w') as f:
             f.write("invalid json content")
         
-        # Should handle gracefully and create new structure
-        with StringIO() as buf, redirect_stdout(buf):
-            tracker = TaskTracker(self.temp_file.name)
-            output = buf.getvalue()
+        # Should handle gracefully and create new structure on first access
+        self._clear_output()
+        tracker = TaskTracker(self.data_file, backup_dir=self.backup_dir)
+        tracker.tasks
+        output = self.stdout.getvalue()
         
         self.assertEqual(len(tracker.tasks["tasks"]), 0)
         self.assertEqual(tracker.tasks["next_id"], 1)
@@ -501,17 +707,33 @@ class TestTaskTracker(unittest.TestCase):
                     "status": "todo",
                     "createdAt": "2025-07-22 10:00:00.000000",
                     "updatedAt": "2025-07-22 10:00:00.000000"
+                },
+                {
+                    "id": 2,
+                    "description": "Hand-edited task",
+                    "status": "todo",
+                    "category": "Work",
+                    "createdAt": "2025-07-22 10:00:00.000000",
+                    "updatedAt": "2025-07-22 10:00:00.000000"
+                },
+                {
+                    "id": 3,
+                    "description": "Task with a null category",
+                    "status": "todo",
+                    "category": None,
+                    "createdAt": "2025-07-22 10:00:00.000000",
+                    "updatedAt": "2025-07-22 10:00:00.000000"
                 }
             ],
-            "next_id": 2
+            "next_id": 4
         }
         
         # Write old format to file
-        with open(self.temp_file.name, 'w') as f:
+        with open(self.data_file, 'w') as f:
             json.dump(old_data, f)
         
         # Load with new tracker
-        tracker = TaskTracker(self.temp_file.name)
+        tracker = TaskTracker(self.data_file, backup_dir=self.backup_dir)
         
         # Check migration
         task = tracker.tasks["tasks"][0]
@@ -519,21 +741,200 @@ class TestTaskTracker(unittest.TestCase):
         self.assertEqual(task["priority"], "medium")
         self.assertIsNone(task["due_date"])
         self.assertIn("metadata", tracker.tasks)
+        
+        # Categories are normalized to lowercase so filters match them
+        self.assertEqual(tracker.tasks["tasks"][1]["category"], "work")
+        self.assertEqual(len(tracker.filter_tasks(tracker.tasks["tasks"], category="WORK")), 1)
+        self.assertEqual(tracker.tasks["tasks"][2]["category"], "general")
+    
+    def test_missing_status_defaults_on_load(self):
+        """Test that a task with a null or missing status loads with the default status."""
+        timestamp = "2025-07-22 10:00:00.000000"
+        data = {
+            "tasks": [
+                {"id": 1, "description": "Null status", "status": None,
+                 "createdAt": timestamp, "updatedAt": timestamp},
+                {"id": 2, "description": "No status",
+                 "createdAt": timestamp, "updatedAt": timestamp},
+            ],
+            "next_id": 3
+        }
+        with open(self.data_file, 'w') as f:
+            json.dump(data, f)
+        
+        tracker = TaskTracker(self.data_file, backup_dir=self.backup_dir)
+        self.assertEqual([t["status"] for t in tracker.tasks["tasks"]], ["todo", "todo"])
+        self.assertEqual(tracker.get_statistics()["status_counts"]["todo"], 2)
+    
+    def test_next_id_repaired_on_load(self):
+        """Test that a stale next_id never reuses an existing task id."""
+        data = {
+            "tasks": [
+                {
+                    "id": 5,
+                    "description": "Imported task",
+                    "status": "todo",
+                    "createdAt": "2025-07-22 10:00:00.000000",
+                    "updatedAt": "2025-07-22 10:00:00.000000"
+                }
+            ]
+        }
+        with open(self.data_file, 'w') as f:
+            json.dump(data, f)
+        
+        tracker = TaskTracker(self.data_file, backup_dir=self.backup_dir)
+        self.assertEqual(tracker.tasks["next_id"], 6)
+
+
+class TestTaskTrackerQueries(TrackerTestMixin, unittest.TestCase):
+    """Test cases that only read or leave unchanged the seed tasks, sharing one tracker."""
+    
+    @classmethod
+    def setUpClass(cls):
+        """Create the tracker shared by every test in the class."""
+        cls._tmpdir = tempfile.TemporaryDirectory(dir=_SCRATCH_ROOT)
+        data_file = os.path.join(cls._tmpdir.name, "tasks.json")
+        cls.tracker = TaskTracker(data_file, backup_dir=Path(data_file).with_suffix(".backups"))
+    
+    @classmethod
+    def tearDownClass(cls):
+        """Remove the class's scratch directory."""
+        cls._tmpdir.cleanup()
+    
+    def setUp(self):
+        """Restore the seed tasks and capture stdout."""
+        self.tracker.tasks = copy.deepcopy(SEED_TASKS)
+        self._capture_stdout()
+    
+    def test_nonexistent_task(self):
+        """Test that every ID-based operation reports a missing task without changes."""
+        initial_count = len(self.tracker.tasks["tasks"])
+        operations = [
+            ("update_task", (999, "Updated task")),
+            ("delete_task", (999,)),
+            ("mark_in_progress", (999,)),
+            ("mark_done", (999,)),
+        ]
+        
+        for name, args in operations:
+            with self.subTest(operation=name):
+                self._clear_output()
+                getattr(self.tracker, name)(*args)
+                output = self.stdout.getvalue()
+                
+                self.assertEqual(len(self.tracker.tasks["tasks"]), initial_count)
+                self.assertIn("Task with ID 999 not found.", output)
+        
+        self.assertIsNone(self.tracker._find_task_by_id(999))
+    
+    def test_list_tasks_invalid_filter(self):
+        """Test listing tasks with invalid filter."""
+        self._clear_output()
+        self.tracker.list_tasks(status_filter="invalid")
+        output = self.stdout.getvalue()
+        
+        self.assertIn("Invalid status 'invalid'", output)
+    
+    def test_filter_tasks(self):
+        """Test task filtering functionality."""
+        # Filter by category
+        filtered = self.tracker.filter_tasks(self.tracker.tasks["tasks"], category="shopping")
+        self.assertEqual(len(filtered), 2)
+        
+        # Filter by priority
+        filtered = self.tracker.filter_tasks(self.tracker.tasks["tasks"], priority="high")
+        self.assertEqual(len(filtered), 1)
+        
+        # Filter by both category and priority
+        filtered = self.tracker.filter_tasks(self.tracker.tasks["tasks"], category="shopping", priority="low")
+        self.assertEqual([t["id"] for t in filtered], [3])
+        
+        # Filter by search query together with other filters
+        filtered = self.tracker.filter_tasks(self.tracker.tasks["tasks"], category="shopping", query="GROCERIES")
+        self.assertEqual([t["id"] for t in filtered], [1])
+    
+    def test_filter_and_sort_plain_tasks(self):
+        """Test that filters and sorts accept task dicts that were never loaded by a tracker."""
+        today = datetime.now().date()
+        plain = [
+            {"id": 1, "description": "Zebra", "status": "todo", "priority": "low",
+             "due_date": str(today + timedelta(days=2))},
+            {"id": 2, "description": "apple", "status": "todo", "category": "work"},
+        ]
+        
+        self.assertEqual([t["id"] for t in self.tracker.sort_tasks(plain, "description")], [2, 1])
+        self.assertEqual([t["id"] for t in self.tracker.sort_tasks(plain, "category")], [1, 2])
+        self.assertEqual([t["id"] for t in self.tracker.filter_tasks(plain, query="ZEB")], [1])
+        self.assertEqual([t["id"] for t in self.tracker.filter_tasks(plain, category="General")], [1])
+        self.assertEqual([t["id"] for t in self.tracker.filter_tasks(plain, priority="medium")], [2])
+        self.assertEqual([t["id"] for t in self.tracker.filter_tasks(plain, due_soon=True)], [1])
+    
+    def test_statistics_without_category(self):
+        """Test that statistics count a task with no category as general."""
+        seed = copy.deepcopy(SEED_TASKS)
+        del seed["tasks"][2]["category"]
+        self.tracker.tasks = seed
+        
+        stats = self.tracker.get_statistics()
+        self.assertEqual(stats["categories"], {"shopping": 1, "work": 1, "general": 1})
+    
+    def test_sort_tasks(self):
+        """Test task sorting functionality."""
+        tasks = self.tracker.tasks["tasks"]
+        
+        # Sort by description
+        sorted_tasks = self.tracker.sort_tasks(tasks, "description")
+        self.assertEqual(
+            [t["description"] for t in sorted_tasks],
+            ["Buy groceries", "Review grocery list", "Write documentation"]
+        )
+        
+        # Sort by priority (reverse) - priority index: low=0, medium=1, high=2
+        # So reverse=True should put high (index 2) first, then low (index 0)
+        sorted_tasks = self.tracker.sort_tasks(tasks, "priority", reverse=True)
+        self.assertEqual([t["priority"] for t in sorted_tasks], ["high", "medium", "low"])
+    
+    def test_statistics(self):
+        """Test statistics functionality."""
+        # Seed tasks have one of each status and priority
+        stats = self.tracker.get_statistics()
+        
+        self.assertEqual(stats["total"], 3)
+        self.assertEqual(stats["status_counts"]["done"], 1)
+        self.assertEqual(stats["status_counts"]["in-progress"], 1)
+        self.assertEqual(stats["status_counts"]["todo"], 1)
+        self.assertAlmostEqual(stats["completion_rate"], 33.3, places=1)
+        
+        # Test category breakdown
+        self.assertEqual(stats["categories"]["shopping"], 2)
+        self.assertEqual(stats["categories"]["work"], 1)
+        
+        # Test priority breakdown
+        self.assertEqual(stats["priority_counts"]["high"], 1)
+        self.assertEqual(stats["priority_counts"]["medium"], 1)
+        self.assertEqual(stats["priority_counts"]["low"], 1)
 
 
-class TestTaskTrackerEdgeCases(unittest.TestCase):
+class TestTaskTrackerEdgeCases(TrackerTestMixin, unittest.TestCase):
     """Test edge cases and error conditions."""
     
+    @classmethod
+    def setUpClass(cls):
+        """Create a scratch directory shared by the class's tests."""
+        cls._tmpdir = tempfile.TemporaryDirectory(dir=_SCRATCH_ROOT)
+    
+    @classmethod
+    def tearDownClass(cls):
+        """Remove the class's scratch directory."""
+        cls._tmpdir.cleanup()
+    
     def setUp(self):
         """Set up test environment."""
-        self.temp_file = tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.json')
-        self.temp_file.close()
-        self.tracker = TaskTracker(self.temp_file.name)
-    
-    def tearDown(self):
-        """Clean up after each test."""
-        if os.path.exists(self.temp_file.name):
-            os.unlink(self.temp_file.name)
+        self.data_file = os.path.join(self._tmpdir.name, f"{self._testMethodName}.json")
+        self.backup_dir = Path(self.data_file).with_suffix(".backups")
+        self.tracker = TaskTracker(self.data_file, backup_dir=self.backup_dir)
+        
+        self._capture_stdout()
     
     def test_whitespace_trimming(self):
         """Test that whitespace is properly trimmed."""
@@ -565,20 +966,70 @@ class TestTaskTrackerEdgeCases(unittest.TestCase):
         
         # Mark as in-progress twice
         self.tracker.mark_in_progress(1)
-        with StringIO() as buf, redirect_stdout(buf):
-            self.tracker.mark_in_progress(1)
-            output = buf.getvalue()
+        self._clear_output()
+        self.tracker.mark_in_progress(1)
+        output = self.stdout.getvalue()
         self.assertIn("Task 1 is already in progress.", output)
         
         # Mark as done twice
         self.tracker.mark_done(1)
-        with StringIO() as buf, redirect_stdout(buf):
-            self.tracker.mark_done(1)
-            output = buf.getvalue()
+        self._clear_output()
+        self.tracker.mark_done(1)
+        output = self.stdout.getvalue()
         self.assertIn("Task 1 is already done.", output)
 
 
+class TestConfig(unittest.TestCase):
+    """Test cases for configuration loading."""
+    
+    def setUp(self):
+        """Create a temporary config file."""
+        tmpdir = tempfile.TemporaryDirectory(dir=_SCRATCH_ROOT)
+        self.addCleanup(tmpdir.cleanup)
+        self.config_file = os.path.join(tmpdir.name, "config.json")
+        with open(self.config_file, 'w') as f:
+            json.dump({"backup_count": 3}, f)
+    
+    def test_config_file_cache(self):
+        """Test that the parsed config file is reused until it changes."""
+        first = Config(self.config_file)
+        self.assertEqual(first.get("backup_count"), 3)
+        
+        # Mutating one instance must not leak into the cached parse
+        first.set("backup_count", 99)
+        second = Config(self.config_file)
+        self.assertEqual(second.get("backup_count"), 3)
+        
+        # A modified file is re-read
+        with open(self.config_file, 'w') as f:
+            json.dump({"backup_count": 7}, f)
+        stat = os.stat(self.config_file)
+        os.utime(self.config_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1))
+        third = Config(self.config_file)
+        self.assertEqual(third.get("backup_count"), 7)
+    
+    def test_defaults_are_isolated(self):
+        """Test that changing nested settings does not alter the defaults."""
+        first = Config(self.config_file)
+        first.get("colors")["todo"] = "magenta"
+        first.get("valid_statuses").append("blocked")
+        
+        self.assertEqual(Config.DEFAULT_CONFIG["colors"]["todo"], "yellow")
+        second = Config(self.config_file)
+        self.assertEqual(second.get("colors")["todo"], "yellow")
+        self.assertNotIn("blocked", second.get("valid_statuses"))
+
+
 if __name__ == "__main__":
+    # Run the tests across all cores when pytest-xdist is available
+    try:
+        import pytest
+        import xdist  # noqa: F401
+    except ImportError:
+        pass
+    else:
+        sys.exit(pytest.main(["-n", "auto", __file__]))
+    
     # Run all tests
     print("Running Enhanced Task Tracker CLI Tests...")
     print("=" * 60)
@@ -589,7 +1040,9 @@ if __name__ == "__main__":
     
     # Add test cases
     suite.addTests(loader.loadTestsFromTestCase(TestTaskTracker))
+    suite.addTests(loader.loadTestsFromTestCase(TestTaskTrackerQueries))
     suite.addTests(loader.loadTestsFromTestCase(TestTaskTrackerEdgeCases))
+    suite.addTests(loader.loadTestsFromTestCase(TestConfig))
     
     # Run tests
     runner = unittest.TextTestRunner(verbosity=2)
@@ -5,10 +5,13 @@ Utilities module for Task Tracker CLI
 This module provides utility functions for formatting, colors, and display.
 """
 
+import re
 import shutil
-from datetime import datetime, timedelta
-from typing import List, Dict, Any
-from config import config
+import signal
+from datetime import date, datetime, timedelta
+from functools import lru_cache
+from typing import List, Dict, Any, Optional
+from config import get_config
 
 try:
     from colorama import init, Fore, Back, Style
@@ -38,57 +41,68 @@ try:
 except ImportError:
     TABULATE_AVAILABLE = False
 
+# The default timestamp format, which isoformat() produces and the C-level
+# datetime.fromisoformat parses, so both can skip strftime/strptime
+ISO_DATE_FORMAT = "%Y-%m-%d %H:%M:%S.%f"
+
+# ANSI escape sequences, compiled once rather than on every strip
+_ANSI_RE = re.compile(r'\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])')
+
+# Color codes by status and priority
+_STATUS_COLORS = {
+    "todo": Fore.YELLOW,
+    "in-progress": Fore.BLUE,
+    "done": Fore.GREEN
+}
+_PRIORITY_COLORS = {
+    "high": Fore.RED + Style.BRIGHT,
+    "medium": Fore.YELLOW,
+    "low": Fore.CYAN
+}
+
 
 def get_color_for_status(status: str) -> str:
     """Get color code for task status."""
     if not COLORS_AVAILABLE:
         return ""
-    
-    color_map = {
-        "todo": Fore.YELLOW,
-        "in-progress": Fore.BLUE,
-        "done": Fore.GREEN
-    }
-    return color_map.get(status, Fore.WHITE)
+    return _STATUS_COLORS.get(status, Fore.WHITE)
 
 
 def get_color_for_priority(priority: str) -> str:
     """Get color code for task priority."""
     if not COLORS_AVAILABLE:
         return ""
-    
-    color_map = {
-        "high": Fore.RED + Style.BRIGHT,
-        "medium": Fore.YELLOW,
-        "low": Fore.CYAN
-    }
-    return color_map.get(priority, Fore.WHITE)
+    return _PRIORITY_COLORS.get(priority, Fore.WHITE)
 
 
 def format_date(date_str: str, short: bool = False) -> str:
     """Format date string for display."""
+    config = get_config()
+    display_format = "%m-%d %H:%M" if short else config.get("display_date_format")
+    return _format_date(date_str, config.get("date_format"), display_format)
+
+
+@lru_cache(maxsize=1024)
+def _format_date(date_str: str, date_format: str, display_format: str) -> str:
+    """Parse and reformat a date string; listings repeat the same timestamps, so results are cached."""
     try:
-        date_format = config.get("date_format")
-        dt = datetime.strptime(date_str, date_format)
-        
-        if short:
-            return dt.strftime("%m-%d %H:%M")
+        if date_format == ISO_DATE_FORMAT:
+            dt = datetime.fromisoformat(date_str)
         else:
-            display_format = config.get("display_date_format")
-            return dt.strftime(display_format)
+            dt = datetime.strptime(date_str, date_format)
+        return dt.strftime(display_format)
     except (ValueError, TypeError):
         return date_str or "N/A"
 
 
-def format_due_date(due_date: str) -> str:
-    """Format due date with color coding based on urgency."""
+def format_due_date(due_date: str, today: Optional[date] = None) -> str:
+    """Format due date with color coding based on urgency, relative to today unless given."""
     if not due_date:
         return "No due date"
     
     try:
-        due = datetime.strptime(due_date, "%Y-%m-%d").date()
-        today = datetime.now().date()
-        days_until = (due - today).days
+        due = date.fromisoformat(due_date)
+        days_until = (due - (today or date.today())).days
         
         if days_until < 0:
             color = Fore.RED + Style.BRIGHT if COLORS_AVAILABLE else ""
@@ -105,14 +119,38 @@ def format_due_date(due_date: str) -> str:
         return due_date
 
 
+@lru_cache(maxsize=1)
 def get_terminal_width() -> int:
-    """Get terminal width for formatting."""
+    """Get terminal width for formatting, cached until the terminal is resized."""
     try:
         return shutil.get_terminal_size().columns
     except Exception:
         return 80  # Default width
 
 
+_resize_handler_installed = False
+
+
+def install_resize_handler() -> None:
+    """Drop the cached terminal width on resize, chaining to any existing SIGWINCH handler."""
+    global _resize_handler_installed
+    # POSIX only, and signal handlers can only be set from the main thread
+    if _resize_handler_installed or not hasattr(signal, "SIGWINCH"):
+        return
+    previous = signal.getsignal(signal.SIGWINCH)
+    
+    def handle_resize(signum, frame):
+        get_terminal_width.cache_clear()
+        if callable(previous):
+            previous(signum, frame)
+    
+    try:
+        signal.signal(signal.SIGWINCH, handle_resize)
+    except ValueError:
+        return
+    _resize_handler_installed = True
+
+
 def truncate_text(text: str, max_length: int) -> str:
     """Truncate text with ellipsis if too long."""
     if len(text) <= max_length:
@@ -127,108 +165,131 @@ def format_task_table(tasks: List[Dict[str, Any]], show_colors: bool = True) ->
     
     # Prepare table data
     headers = ["ID", "Description", "Status", "Priority", "Category", "Due Date", "Created"]
-    table_data = []
     
     terminal_width = get_terminal_width()
     desc_width = max(20, min(40, terminal_width // 4))
     
+    # Apply colors if available and requested; empty tables and codes leave cells plain
+    if show_colors and COLORS_AVAILABLE:
+        status_colors, priority_colors = _STATUS_COLORS, _PRIORITY_COLORS
+        white, reset = Fore.WHITE, Style.RESET_ALL
+    else:
+        status_colors = priority_colors = {}
+        white = reset = ""
+    
+    # Bind the per-row helpers to locals for the loop
+    format_due, format_created = format_due_date, format_date
+    today = date.today()
+    cut = desc_width - 3
+    
+    table_data = []
+    append = table_data.append
     for task in tasks:
-        status = task["status"]
-        priority = task["priority"]
-        
-        # Apply colors if available and requested
-        if show_colors and COLORS_AVAILABLE:
-            status_colored = f"{get_color_for_status(status)}{status}{Style.RESET_ALL}"
-            priority_colored = f"{get_color_for_priority(priority)}{priority}{Style.RESET_ALL}"
-        else:
-            status_colored = status
-            priority_colored = priority
-        
-        row = [
+        description = task["description"]
+        # truncate_text, inlined to save a call per row
+        if len(description) > desc_width:
+            description = description[:cut] + "..."
+        append((
             task["id"],
-            truncate_text(task["description"], desc_width),
-            status_colored,
-            priority_colored,
+            description,
+            f"{status_colors.get(task['status'], white)}{task['status']}{reset}",
+            f"{priority_colors.get(task['priority'], white)}{task['priority']}{reset}",
             task.get("category", "general"),
-            format_due_date(task.get("due_date")),
-            format_date(task["createdAt"], short=True)
-        ]
-        table_data.append(row)
+            format_due(task.get("due_date"), today),
+            format_created(task["createdAt"], short=True)
+        ))
     
     if TABULATE_AVAILABLE:
         return tabulate(table_data, headers=headers, tablefmt="grid")
     else:
         # Fallback to simple formatting
-        return format_simple_table(headers, table_data)
-
-
-def format_simple_table(headers: List[str], data: List[List[str]]) -> str:
-    """Simple table formatting fallback."""
-    # Calculate column widths
-    col_widths = [len(header) for header in headers]
-    for row in data:
-        for i, cell in enumerate(row):
-            # Strip ANSI color codes for width calculation
-            clean_cell = strip_ansi_codes(str(cell))
-            col_widths[i] = max(col_widths[i], len(clean_cell))
+        # Due dates are colored whenever colorama is present, even with show_colors off
+        return format_simple_table(headers, table_data, has_ansi=COLORS_AVAILABLE)
+
+
+def format_simple_table(headers: List[str], data: List[List[str]], has_ansi: bool = True) -> str:
+    """Simple table formatting fallback; pass has_ansi=False when no cell is colored."""
+    cells = [[str(cell) for cell in row] for row in data]
+    # Strip ANSI color codes once; the clean text gives both widths and padding
+    if has_ansi:
+        clean_cells = [[_ANSI_RE.sub('', cell) for cell in row] for row in cells]
+    else:
+        clean_cells = cells
     
-    # Create format string
-    format_str = " | ".join(f"{{:<{width}}}" for width in col_widths)
+    # Calculate column widths, one max() per column
+    col_widths = [
+        max(len(header), *map(len, column))
+        for header, column in zip(headers, zip(*clean_cells))
+    ] if clean_cells else [len(header) for header in headers]
     
-    # Build table
-    result = []
-    result.append(format_str.format(*headers))
-    result.append("-" * (sum(col_widths) + 3 * (len(headers) - 1)))
+    # Build table; ljust pads without going through the format-spec parser
+    result = [
+        " | ".join([header.ljust(width) for header, width in zip(headers, col_widths)]),
+        "-" * (sum(col_widths) + 3 * (len(headers) - 1)),
+    ]
     
-    for row in data:
-        formatted_row = []
-        for i, cell in enumerate(row):
-            if COLORS_AVAILABLE and any(color in str(cell) for color in [Fore.RED, Fore.GREEN, Fore.YELLOW, Fore.BLUE, Fore.CYAN]):
-                # For colored cells, pad after stripping color codes
-                clean_cell = strip_ansi_codes(str(cell))
-                padding = col_widths[i] - len(clean_cell)
-                formatted_row.append(str(cell) + " " * padding)
-            else:
-                formatted_row.append(f"{cell:<{col_widths[i]}}")
-        result.append(" | ".join(formatted_row))
+    for row, clean_row in zip(cells, clean_cells):
+        # Pad by the visible length so colored cells line up
+        result.append(" | ".join([
+            cell + " " * (width - len(clean_cell))
+            for cell, clean_cell, width in zip(row, clean_row, col_widths)
+        ]))
     
     return "\n".join(result)
 
 
 def strip_ansi_codes(text: str) -> str:
     """Strip ANSI color codes from text."""
-    import re
-    ansi_escape = re.compile(r'\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])')
-    return ansi_escape.sub('', text)
+    return _ANSI_RE.sub('', text)
+
+
+# Color and symbol for each message level
+_LEVELS = {
+    "success": (Fore.GREEN, "✓"),
+    "error": (Fore.RED, "✗"),
+    "warning": (Fore.YELLOW, "⚠"),
+    "info": (Fore.BLUE, "ℹ"),
+}
+
+
+def _format_message(level: str, message: str) -> str:
+    """Format a message with the symbol and color of its level."""
+    color, symbol = _LEVELS[level]
+    if COLORS_AVAILABLE:
+        return f"{color}{symbol} {message}{Style.RESET_ALL}"
+    return f"{symbol} {message}"
+
+
+def format_success(message: str) -> str:
+    """Format success message with green color."""
+    return _format_message("success", message)
 
 
 def print_success(message: str) -> None:
     """Print success message with green color."""
-    if COLORS_AVAILABLE:
-        print(f"{Fore.GREEN}✓ {message}{Style.RESET_ALL}")
-    else:
-        print(f"✓ {message}")
+    print(_format_message("success", message))
 
 
 def print_error(message: str) -> None:
     """Print error message with red color."""
-    if COLORS_AVAILABLE:
-        print(f"{Fore.RED}✗ {message}{Style.RESET_ALL}")
-    else:
-        print(f"✗ {message}")
+    print(_format_message("error", message))
+
+
+def format_warning(message: str) -> str:
+    """Format warning message with yellow color."""
+    return _format_message("warning", message)
 
 
 def print_warning(message: str) -> None:
     """Print warning message with yellow color."""
-    if COLORS_AVAILABLE:
-        print(f"{Fore.YELLOW}⚠ {message}{Style.RESET_ALL}")
-    else:
-        print(f"⚠ {message}")
+    print(_format_message("warning", message))
+
+
+def format_info(message: str) -> str:
+    """Format info message with blue color."""
+    return _format_message("info", message)
 
 
 def print_info(message: str) -> None:
     """Print info message with blue color."""
-    if COLORS_AVAILABLE:
-        print(f"{Fore.BLUE}ℹ {message}{Style.RESET_ALL}")
-    else:
-        print(f"ℹ {message}")
+    print(_format_message("info", message))